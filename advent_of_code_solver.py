@@ -1,15 +1,87 @@
+import io
+import typing
 from abc import ABC, abstractmethod
-from typing import TextIO
+from typing import Any, Iterable, Iterator, Optional, TextIO, Tuple
+
+if typing.TYPE_CHECKING:
+    # The parse cache is only imported when it is used, since hashing and pickling are slow to import.
+    from parse_cache import ParseCache
 
 
 class BaseSolver(ABC):
-    def __init__(self, input_file):
+    # The number of processes that the solver uses. Schedulers reserve this many CPUs for it, and may lower it
+    # to fit within their CPU budget.
+    PROCESSES = 1
+
+    # The implementations that the solver can be run with, e.g. a vectorised one. The first one is the default.
+    ENGINES: Tuple[str, ...] = ("python",)
+
+    def __init__(self, input_file, engine: Optional[str] = None):
+        if engine is not None and engine not in self.ENGINES:
+            raise ValueError(
+                f"unknown engine {engine!r}, expected one of: {', '.join(self.ENGINES)}"
+            )
+
         self.input = None
         self.input_file = input_file
+        self.engine = engine or self.ENGINES[0]
+
+    def read_input_file(self, cache: Optional["ParseCache"] = None):
+        with open(self.input_file, "rb") as file:
+            self.load_input(file.read(), cache)
+
+    def load_input(self, data: bytes, cache: Optional["ParseCache"] = None) -> None:
+        """
+        Parses the raw input. If a cache is given, the parsed input is loaded from it when possible,
+        and stored in it otherwise.
+        """
+        key = None
+        if cache is not None:
+            key = cache.key(type(self), data, self.engine)
+            hit, value = cache.get(key)
+            if hit:
+                self.input = value
+                return
 
-    def read_input_file(self):
+        # Decode the input the same way as a file opened in text mode.
+        self.input = self.parse_input(io.TextIOWrapper(io.BytesIO(data)))
+
+        if cache is not None:
+            cache.put(key, self.input)
+
+    def stream_input_file(self) -> Iterator[str]:
+        """
+        Lazily yields the lines of the input file without their line endings,
+        so that the whole file is never held in memory.
+        """
         with open(self.input_file, "r") as file:
-            self.input = self.parse_input(file)
+            for line in file:
+                yield line.rstrip("\n")
+
+    @classmethod
+    def supports_streaming(cls) -> bool:
+        return cls.solve_stream is not BaseSolver.solve_stream
+
+    def solve_stream(self, lines: Iterable[str]) -> Tuple[Any, Any]:
+        """
+        Optional streaming mode for line-oriented inputs. Solves both parts in a single pass over the lines,
+        folding each line into the answers, so that peak memory is bounded by the working set of the solver
+        rather than the size of the input.
+        :return: A tuple of (part1, part2)
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def shares_work(cls) -> bool:
+        return cls.solve_both is not BaseSolver.solve_both
+
+    def solve_both(self) -> Tuple[Any, Any]:
+        """
+        Solves both parts together. Solvers can override this to compute the intermediates that both parts need
+        only once, instead of each part redoing the same work.
+        :return: A tuple of (part1, part2)
+        """
+        return self.solve_part1(), self.solve_part2()
 
     @abstractmethod
     def parse_input(self, file: TextIO):
@@ -0,0 +1,33 @@
+import random
+from string import ascii_lowercase
+
+from .utils import DIGIT_LETTERS
+
+BASE_SIZE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a calibration document with the given number of lines.
+    Every line contains at least one numeric digit, so that it is valid for both parts.
+    """
+    rng = random.Random(seed)
+    lines = []
+
+    for _ in range(size):
+        tokens = []
+        for _ in range(rng.randint(2, 8)):
+            roll = rng.random()
+            if roll < 0.2:
+                tokens.append(str(rng.randint(1, 9)))
+            elif roll < 0.5:
+                tokens.append(rng.choice(DIGIT_LETTERS))
+            else:
+                tokens.append(
+                    "".join(rng.choices(ascii_lowercase, k=rng.randint(1, 5)))
+                )
+
+        tokens.insert(rng.randint(0, len(tokens)), str(rng.randint(1, 9)))
+        lines.append("".join(tokens))
+
+    return "\n".join(lines) + "\n"
@@ -1,36 +1,44 @@
-import re
-
 from advent_of_code_solver import BaseSolver
 
-DIGIT_LETTERS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
-
-
-def get_calibration_value(line: str) -> int:
-    """
-    Get the calibration value, which is the combination of the first and last digit of the line.
-    """
-    digits = re.findall(r"\d", line)
-    return int(digits[0] + digits[-1])
+from .utils import map_file, sum_calibration_values
 
 
-def replace_digit_letters(line: str) -> str:
-    """
-    Replace digit letters with their corresponding digits.
-    """
-    for digit, letter in enumerate(DIGIT_LETTERS, start=1):
-        line = line.replace(letter, f"{letter}{digit}{letter}")
+class Solver(BaseSolver):
+    ENGINES = ("python", "numpy")
 
-    return line
+    def read_input_file(self, cache=None):
+        if cache is not None:
+            super().read_input_file(cache)
+            return
 
+        # Both scanners accept any bytes-like object, so the file is scanned through a memory map of it,
+        # which is never read into memory, however large the file is.
+        self.input = map_file(self.input_file)
 
-class Solver(BaseSolver):
     def parse_input(self, file):
-        return file.read().splitlines()
+        # The scanners work on bytes, so the input is read from the underlying binary buffer, without decoding it.
+        return file.buffer.read()
 
     def solve_part1(self):
-        return sum(get_calibration_value(line) for line in self.input)
+        return self.sum_calibration_values(self.input)
 
     def solve_part2(self):
-        return sum(
-            get_calibration_value(replace_digit_letters(line)) for line in self.input
-        )
+        return self.sum_calibration_values(self.input, letters=True)
+
+    def sum_calibration_values(self, data: bytes, letters: bool = False) -> int:
+        if self.engine == "numpy":
+            # NumPy is optional, so it is only imported by its engine.
+            from .vectorised import sum_calibration_values as sum_vectorised
+
+            return sum_vectorised(data, letters)
+
+        return sum_calibration_values(data, letters)
+
+    def solve_stream(self, lines):
+        part1 = part2 = 0
+        for line in lines:
+            data = line.encode()
+            part1 += sum_calibration_values(data)
+            part2 += sum_calibration_values(data, letters=True)
+
+        return part1, part2
@@ -0,0 +1,70 @@
+import mmap
+import re
+from typing import Dict, Union
+
+DIGIT_LETTERS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+# The value of each token that can be scanned, as bytes.
+DIGIT_VALUES: Dict[bytes, int] = {
+    **{str(digit).encode(): digit for digit in range(10)},
+    **{letter.encode(): digit for digit, letter in enumerate(DIGIT_LETTERS, start=1)},
+}
+
+
+def compile_scanner(token: bytes) -> re.Pattern:
+    """
+    Compiles a pattern that matches each line that contains a token, capturing its first and last token.
+
+    | Structure:
+    | - The lazy prefix stops at the first position where a token starts. The token is captured in a lookahead,
+        so the first token is not consumed. Otherwise, the last token could not overlap it, as in "oneight".
+    | - The greedy suffix backtracks from the end of the line to the last position where a token starts,
+        which is the first token itself if the line has only one.
+
+    Both ends of each line are found in a single scan by the regex engine, without any per-character Python code.
+    """
+    return re.compile(
+        rb"^[^\n]*?(?=(" + token + rb"))[^\n]*(" + token + rb")", re.MULTILINE
+    )
+
+
+DIGIT_SCANNER = compile_scanner(rb"\d")
+LETTER_SCANNER = compile_scanner(rb"\d|" + "|".join(DIGIT_LETTERS).encode())
+
+
+def sum_calibration_values(data: bytes, letters: bool = False) -> int:
+    """
+    Sums the calibration values of all the lines of the data, which can be any bytes-like object, e.g. a memory map.
+    The calibration value of a line is the combination of its first and last digit. Lines without digits are skipped.
+    :param letters: Whether spelled out digits count as digits
+    """
+    scanner = LETTER_SCANNER if letters else DIGIT_SCANNER
+    return sum(
+        10 * DIGIT_VALUES[first] + DIGIT_VALUES[last]
+        for first, last in scanner.findall(data)
+    )
+
+
+def map_file(path: str) -> Union[mmap.mmap, bytes]:
+    """
+    Maps a file into memory read-only, so that it can be scanned at near I/O speed without reading it into memory.
+    """
+    with open(path, "rb") as file:
+        # Empty files cannot be memory mapped.
+        if not file.seek(0, 2):
+            return b""
+
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def sum_calibration_file(path: str, letters: bool = False) -> int:
+    """
+    Sums the calibration values of a file without reading it into memory, by scanning a memory map of it instead.
+    This is the entry point for calibration files that are too large to read, e.g. several GB.
+    """
+    data = map_file(path)
+    try:
+        return sum_calibration_values(data, letters)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
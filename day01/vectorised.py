@@ -0,0 +1,125 @@
+"""
+A vectorised NumPy engine for the calibration values, which finds every token of the whole document with array
+operations instead of scanning it line by line. NumPy is optional, so this module is only imported by the solver's
+"numpy" engine.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .utils import DIGIT_LETTERS
+
+NEWLINE = ord("\n")
+ZERO = ord("0")
+
+# The number of bytes processed at once, which bounds the memory of the temporary arrays.
+CHUNK_SIZE = 1024 * 1024
+
+# The distinct bytes of the spelled out digits.
+LETTERS = sorted(set("".join(DIGIT_LETTERS).encode()))
+
+# The row of the equality mask of each byte of each spelled out digit, and its value.
+LETTER_TOKENS = [
+    ([LETTERS.index(byte) for byte in letter.encode()], digit)
+    for digit, letter in enumerate(DIGIT_LETTERS, start=1)
+]
+
+
+def letter_masks(size: int) -> np.ndarray:
+    """
+    Allocates the scratch space of token_values for buffers of up to the given size.
+    The rows are the equality masks of each letter, followed by the matches of a spelled out digit.
+    """
+    return np.empty((len(LETTERS) + 1, size), dtype=bool)
+
+
+def token_values(
+    buffer: np.ndarray, letters: bool = False, masks: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Maps each position of the buffer to the value of the token that starts there, or to at least 10 if none does.
+    | Structure:
+    | - Subtracting "0" with uint8 wraparound maps the digits "0".."9" to 0..9, and every other byte to at least 10.
+    | - A spelled out digit starts at every position where each of its bytes matches the buffer shifted by
+        the byte's offset. The equality mask of each distinct letter is computed only once.
+    No spelled out digit is a prefix of another, so at most one token starts at each position,
+    and overlapping tokens such as "oneight" are both found. Tokens never span lines, since newlines are not letters.
+    :param masks: Scratch space from letter_masks, which is reused between calls since allocating (and paging in)
+        fresh arrays is slower than the comparisons themselves
+    """
+    values = buffer - np.uint8(ZERO)
+    if not letters:
+        return values
+
+    size = len(buffer)
+    if masks is None or masks.shape[1] < size:
+        masks = letter_masks(size)
+    masks = masks[:, :size]
+
+    for row, byte in enumerate(LETTERS):
+        np.equal(buffer, byte, out=masks[row])
+
+    for rows, digit in LETTER_TOKENS:
+        count = size - len(rows) + 1
+        if count <= 0:
+            continue
+
+        matches = masks[-1, :count]
+        np.copyto(matches, masks[rows[0], :count])
+        for offset in range(1, len(rows)):
+            matches &= masks[rows[offset], offset : offset + count]
+
+        values[:count][matches] = digit
+
+    return values
+
+
+def sum_chunk(
+    buffer: np.ndarray, letters: bool = False, masks: Optional[np.ndarray] = None
+) -> int:
+    """
+    Sums the calibration values of a buffer of whole lines.
+    The tokens and newlines are gathered in the order that they appear, so the first token of each line is
+    the one that is not preceded by a token, and the last token is the one that is not followed by a token.
+    """
+    values = token_values(buffer, letters, masks)
+    values = values[np.flatnonzero((values < 10) | (buffer == NEWLINE))]
+
+    is_token = values < 10
+    first = is_token.copy()
+    first[1:] &= ~is_token[:-1]
+    last = is_token.copy()
+    last[:-1] &= ~is_token[1:]
+
+    values = values.astype(np.int64)
+    return int(10 * values[first].sum() + values[last].sum())
+
+
+def sum_calibration_values(
+    data: bytes, letters: bool = False, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Sums the calibration values of all the lines of the data, like utils.sum_calibration_values.
+    The data is split into chunks of whole lines, which are viewed as arrays without copying them.
+    :param data: Any bytes-like object
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    size = len(buffer)
+    masks = letter_masks(min(chunk_size, size)) if letters else None
+    total = 0
+
+    start = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            # Cut the chunk after its last newline, or after the end of its line if it is longer than the chunk.
+            newline = data.rfind(b"\n", start, end)
+            if newline < 0:
+                newline = data.find(b"\n", end)
+            end = newline + 1 if newline >= 0 else size
+
+        total += sum_chunk(buffer[start:end], letters, masks)
+        start = end
+
+    return total
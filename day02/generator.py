@@ -0,0 +1,25 @@
+import random
+
+from .utils import BLUE, GREEN, RED
+
+BASE_SIZE = 100
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a game record with the given number of games.
+    """
+    rng = random.Random(seed)
+    lines = []
+
+    for game_id in range(1, size + 1):
+        subsets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample((RED, GREEN, BLUE), rng.randint(1, 3))
+            subsets.append(
+                ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+            )
+
+        lines.append(f"Game {game_id}: " + "; ".join(subsets))
+
+    return "\n".join(lines) + "\n"
@@ -1,50 +1,52 @@
-import re
-from collections import Counter
-from functools import reduce
-from typing import List
+from typing import List, Sequence, Tuple
 
 from advent_of_code_solver import BaseSolver
 
-RED = "red"
-GREEN = "green"
-BLUE = "blue"
+from .utils import GameStore, get_cubes_power, is_possible_game
 
-
-def get_cubes_power(subsets: List[Counter]) -> int:
-    """
-    Get the fewest number of cubes required to make the game, then find the power of the set of cubes.
-    :return: The set power, which is the product of the number of cubes of each color.
-    """
-    required = reduce(lambda x, y: x | y, subsets)
-    return required[RED] * required[GREEN] * required[BLUE]
+# The number of red, green and blue cubes in the bag.
+BAG = (12, 13, 14)
 
 
 class Solver(BaseSolver):
+    ENGINES = ("python", "numpy")
+
     def parse_input(self, file):
-        return [
-            self._get_subset_list(line.split(": ")[1])
-            for line in file.read().splitlines()
-        ]
+        return GameStore.from_lines(file)
 
     def solve_part1(self):
-        bag = Counter({RED: 12, GREEN: 13, BLUE: 14})
-        return sum(
-            game_id
-            for game_id, game in enumerate(self.input, start=1)
-            if all(bag >= subset for subset in game)
-        )
+        return self.possible_id_sums([BAG])[0]
 
     def solve_part2(self):
-        return sum(get_cubes_power(game) for game in self.input)
+        if self.engine == "numpy":
+            # NumPy is optional, so it is only imported by its engine.
+            from .vectorised import power_sum
+
+            return power_sum(self.input)
+
+        return self.input.power_sum()
+
+    def possible_id_sums(self, bags: Sequence[Tuple[int, int, int]]) -> List[int]:
+        """
+        Sums the IDs of the games that are possible with each of the bags, evaluating all of them in a single call.
+        """
+        if self.engine == "numpy":
+            from .vectorised import possible_id_sums
+
+            return possible_id_sums(self.input, bags)
+
+        return self.input.possible_id_sums(bags)
 
-    @staticmethod
-    def _get_subset_list(line: str) -> List[Counter]:
-        result = []
+    def solve_stream(self, lines):
+        part1 = part2 = game_id = 0
+        for line in lines:
+            # Blank lines are skipped, as when the whole record is parsed.
+            if not line.strip():
+                continue
 
-        for subset in line.split("; "):
-            cubes = Counter(
-                {color: int(num) for num, color in re.findall(r"(\d+) (\w+)", subset)}
-            )
-            result.append(cubes)
+            game_id += 1
+            cubes = GameStore.parse_line(line)
+            part1 += game_id if is_possible_game(cubes, BAG) else 0
+            part2 += get_cubes_power(cubes)
 
-        return result
+        return part1, part2
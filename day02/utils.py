@@ -0,0 +1,89 @@
+import re
+from array import array
+from typing import Iterable, List, Sequence, Tuple
+
+RED = "red"
+GREEN = "green"
+BLUE = "blue"
+COLORS = (RED, GREEN, BLUE)
+
+# The number of cubes of each color, in the order of COLORS.
+Cubes = Tuple[int, int, int]
+
+DRAW_PATTERN = re.compile(rf"(\d+) ({'|'.join(COLORS)})")
+
+
+def get_cubes_power(cubes: Cubes) -> int:
+    """
+    :return: The set power, which is the product of the number of cubes of each color.
+    """
+    red, green, blue = cubes
+    return red * green * blue
+
+
+def is_possible_game(cubes: Cubes, bag: Cubes) -> bool:
+    """
+    Checks if the game, given the fewest cubes it requires, is possible with the cubes in the bag.
+    """
+    return all(required <= available for required, available in zip(cubes, bag))
+
+
+class GameStore:
+    """
+    A columnar store of the fewest cubes required by each game, whose ID is its 1-based position in the game record.
+    The cubes are stored as consecutive (red, green, blue) rows of a single fixed-width integer array,
+    so a game takes 12 bytes, and the array can be viewed as a NumPy array without copying it.
+    """
+
+    TYPECODE = "I"
+
+    def __init__(self):
+        self.cubes = array(self.TYPECODE)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "GameStore":
+        """
+        Fills a store from the lines of a game record, one line at a time. Blank lines are skipped.
+        """
+        store = cls()
+        for line in lines:
+            if not line.strip():
+                continue
+
+            store.cubes.extend(cls.parse_line(line))
+        return store
+
+    @staticmethod
+    def parse_line(line: str) -> Cubes:
+        """
+        Gets the fewest number of cubes of each color that make the game possible, which is the largest number of
+        cubes of that color drawn in any subset. Subsets do not need to be split, since only the largest draw matters.
+        """
+        required = dict.fromkeys(COLORS, 0)
+        for num, color in DRAW_PATTERN.findall(line):
+            num = int(num)
+            if num > required[color]:
+                required[color] = num
+
+        return required[RED], required[GREEN], required[BLUE]
+
+    def __len__(self) -> int:
+        return len(self.cubes) // len(COLORS)
+
+    def games(self) -> Iterable[Cubes]:
+        cubes = iter(self.cubes)
+        return zip(cubes, cubes, cubes)
+
+    def possible_id_sums(self, bags: Sequence[Cubes]) -> List[int]:
+        """
+        Sums the IDs of the games that are possible with each of the bags.
+        """
+        sums = [0] * len(bags)
+        for game_id, game in enumerate(self.games(), start=1):
+            for i, bag in enumerate(bags):
+                if is_possible_game(game, bag):
+                    sums[i] += game_id
+        return sums
+
+    def power_sum(self) -> int:
+        return sum(map(get_cubes_power, self.games()))
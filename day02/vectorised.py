@@ -0,0 +1,60 @@
+"""
+A vectorised NumPy engine for the game store, which evaluates every game with array reductions.
+NumPy is optional, so this module is only imported by the solver's "numpy" engine.
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from .utils import COLORS, Cubes, GameStore
+
+# The largest number of (bag, game) pairs compared at once, which bounds the memory of the temporary arrays.
+BLOCK_SIZE = 1 << 22
+
+
+def as_array(store: GameStore) -> np.ndarray:
+    """
+    Views the cubes of the store as an array of shape (games, colors), without copying them.
+    """
+    cubes = np.frombuffer(store.cubes, dtype=np.uintc)
+    return cubes.reshape(-1, len(COLORS))
+
+
+def possible_id_sums(store: GameStore, bags: Sequence[Cubes]) -> List[int]:
+    """
+    Sums the IDs of the games that are possible with each of the bags, like GameStore.possible_id_sums.
+    The bags are compared with every game in blocks, and the feasibility matrix of each block is reduced to
+    the sums with a single matrix-vector product.
+    """
+    games = as_array(store)
+    bags = np.asarray(bags, dtype=np.int64).reshape(-1, len(COLORS))
+    game_ids = np.arange(1, len(games) + 1, dtype=np.int64)
+
+    sums = []
+    block = max(1, BLOCK_SIZE // max(1, len(games)))
+    for start in range(0, len(bags), block):
+        limits = bags[start : start + block, :, np.newaxis]
+
+        possible = games[:, 0] <= limits[:, 0]
+        for color in range(1, len(COLORS)):
+            possible &= games[:, color] <= limits[:, color]
+
+        sums.extend((possible @ game_ids).tolist())
+
+    return sums
+
+
+def power_sum(store: GameStore) -> int:
+    """
+    Sums the powers of the games, like GameStore.power_sum.
+    The products are computed in int64, unless they could overflow it, in which case they fall back to Python ints.
+    """
+    games = as_array(store)
+    if not len(games):
+        return 0
+
+    largest = int(games.max())
+    exact = largest ** len(COLORS) * len(games) < 2**63
+    powers = games.astype(np.int64 if exact else object).prod(axis=1)
+    return int(powers.sum())
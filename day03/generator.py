@@ -0,0 +1,31 @@
+import random
+from math import isqrt
+
+BASE_SIZE = 140 * 140
+
+SYMBOLS = "*#+$/@%=&-"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a square engine schematic with roughly the given number of cells.
+    """
+    rng = random.Random(seed)
+    n = max(isqrt(size), 3)
+    lines = []
+
+    for _ in range(n):
+        row = []
+        while len(row) < n:
+            roll = rng.random()
+            if roll < 0.15:
+                # Numbers are always followed by a period, so that adjacent numbers do not merge.
+                row.extend(str(rng.randint(1, 999)) + ".")
+            elif roll < 0.2:
+                row.append("*" if rng.random() < 0.4 else rng.choice(SYMBOLS))
+            else:
+                row.extend("." * rng.randint(1, 3))
+
+        lines.append("".join(row[:n]))
+
+    return "\n".join(lines) + "\n"
@@ -4,14 +4,20 @@ from .utils import Schematic
 
 
 class Solver(BaseSolver):
+    ENGINES = ("python", "numpy")
+
     def parse_input(self, file):
+        if self.engine == "numpy":
+            # NumPy is optional, so it is only imported by its engine.
+            from .vectorised import as_grid, process_grid
+
+            return process_grid(as_grid(file.read().encode()))
+
         grid = [line.strip() for line in file.read().splitlines()]
         return Schematic(grid)
 
     def solve_part1(self):
-        schematic: Schematic = self.input
-        return sum(schematic.part_numbers)
+        return self.input.part_number_sum
 
     def solve_part2(self):
-        schematic: Schematic = self.input
-        return sum(schematic.gear_ratios)
+        return self.input.gear_ratio_sum
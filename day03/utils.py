@@ -1,79 +1,199 @@
-from dataclasses import dataclass, field
-from typing import List, Set, Tuple
+import re
+from array import array
+from dataclasses import InitVar, dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+NUMBER = re.compile(rb"\d+")
+SYMBOL = re.compile(rb"[^\d.]")
+DOT = ord(".")
+GEAR = ord("*")
+
+Coordinate = Tuple[int, int]
+
+
+def is_symbol(cell: int) -> bool:
+    return cell != DOT and not 0x30 <= cell <= 0x39
 
 
 @dataclass
 class Schematic:
-    grid: List[str]
+    grid: InitVar[List[str]]
 
     # Helper attributes
     m: int = field(init=False)  # Number of rows
     n: int = field(init=False)  # Number of columns
-    seen: Set[Tuple[int, int]] = field(
-        init=False, default_factory=set
-    )  # Stores coordinates of parts that have been seen
+    cells: List[bytearray] = field(init=False)  # The rows, updated by set_cell
+    labels: List[array] = field(init=False)  # The ID of the number at each cell, or 0
+    numbers: Dict[int, Tuple[int, int, int, int]] = field(
+        init=False, default_factory=dict
+    )  # The (row, start, end, value) of each number ID, with exclusive ends
+    next_id: int = field(init=False, default=1)
+
+    # The index between the symbols and the numbers that they touch. Numbers that touch no symbol are left out.
+    symbol_parts: Dict[Coordinate, Set[int]] = field(init=False, default_factory=dict)
+    number_symbols: Dict[int, Set[Coordinate]] = field(init=False, default_factory=dict)
+
+    # Solution-specific attributes, which are kept up to date by set_cell
+    part_number_sum: int = field(init=False, default=0)
+    gear_ratio_sum: int = field(init=False, default=0)
+
+    def __post_init__(self, grid: List[str]):
+        self.m = len(grid)
+        self.n = len(grid[0]) if grid else 0
+        self.cells = [bytearray(row.encode()) for row in grid]
+        self.labels = [array("i", [0]) * self.n for _ in range(self.m)]
 
-    # Solution-specific attributes
-    part_numbers: List[int] = field(init=False, default_factory=list)
-    gear_ratios: List[int] = field(init=False, default_factory=list)
+        self._process_grid()
 
-    def __post_init__(self):
-        self.m = len(self.grid)
-        self.n = len(self.grid[0])
+    @property
+    def part_numbers(self) -> List[int]:
+        return [self.numbers[number_id][3] for number_id in self.number_symbols]
 
-        self._process_grid()
+    @property
+    def gear_ratios(self) -> List[int]:
+        return [
+            ratio
+            for ratio in map(self._gear_ratio, self.symbol_parts)
+            if ratio is not None
+        ]
+
+    def set_cell(self, r: int, c: int, ch: str) -> None:
+        """
+        Changes the cell at (r, c), and updates the part numbers and gear ratios.
+        Only the numbers that overlap the cell or its left and right neighbours are relabelled,
+        so the update takes time proportional to their length, rather than to the size of the grid.
+        """
+        row = self.cells[r]
+        cell = ord(ch)
+        if row[c] == cell:
+            return
+
+        if is_symbol(row[c]):
+            self._remove_symbol((r, c))
+
+        # A digit can change, split or merge the numbers next to it, so they are relabelled.
+        start, end = c, c + 1
+        for number_id in {
+            self.labels[r][col] for col in range(max(c - 1, 0), min(c + 2, self.n))
+        }:
+            if number_id:
+                _, number_start, number_end, _ = self.numbers[number_id]
+                start, end = min(start, number_start), max(end, number_end)
+                self._remove_number(number_id)
+
+        # The symbol is indexed first, so that the relabelled numbers can be linked to it.
+        row[c] = cell
+        if is_symbol(cell):
+            self._add_symbol((r, c))
+
+        for match in NUMBER.finditer(row, start, end):
+            self._add_number(r, match.start(), match.end())
 
     def _process_grid(self) -> None:
         """
-        Processes the grid to find part numbers and gear ratios.
+        Labels every number and indexes every symbol of the grid.
 
         | Algorithm:
-        | 1. Iterate through the grid.
-        | 2. If the current cell is a number or period (".") then skip it.
-        | 3. If the current cell is a symbol, then add the part numbers of the adjacent cells to
-             the list of part numbers.
-        | 4. If the current cell is a gear ("*") and has exactly two adjacent cells that are part numbers,
-             then add the product of the two part numbers to the list of gear ratios.
+        | 1. Label every number of each row once, with a regex scan of the row.
+        | 2. Index each symbol with the labels of its neighbours, which are the numbers that it touches.
+        | 3. A number is a part number if it touches any symbol. A gear ("*") that touches exactly two numbers
+             adds their product to the gear ratios.
         """
-        for r in range(self.m):
-            for c in range(self.n):
-                if self.grid[r][c] == "." or self.grid[r][c].isdigit():
-                    continue
+        for r, row in enumerate(self.cells):
+            for match in NUMBER.finditer(row):
+                self._label_number(r, match.start(), match.end())
 
-                curr_part_numbers = []
-                for x, y in self._adjacent_coords(r, c):
-                    if self.grid[x][y].isdigit() and (x, y) not in self.seen:
-                        curr_part_numbers.append(self._construct_part_number(x, y))
+        for r, row in enumerate(self.cells):
+            for match in SYMBOL.finditer(row):
+                self._add_symbol((r, match.start()))
 
-                if len(curr_part_numbers) == 2 and self.grid[r][c] == "*":
-                    self.gear_ratios.append(curr_part_numbers[0] * curr_part_numbers[1])
+    def _neighbours(self, r: int, start: int, end: int) -> List[Coordinate]:
+        """
+        Returns the coordinates around the cells start..end of row r that are within the grid, including diagonals.
+        """
+        cols = range(max(start - 1, 0), min(end + 1, self.n))
+        return [(x, y) for x in range(max(r - 1, 0), min(r + 2, self.m)) for y in cols]
+
+    def _label_number(self, r: int, start: int, end: int) -> int:
+        number_id = self.next_id
+        self.next_id += 1
+
+        self.numbers[number_id] = (r, start, end, int(self.cells[r][start:end]))
+        labels = self.labels[r]
+        for col in range(start, end):
+            labels[col] = number_id
+        return number_id
+
+    def _add_number(self, r: int, start: int, end: int) -> None:
+        number_id = self._label_number(r, start, end)
+        for x, y in self._neighbours(r, start, end):
+            if is_symbol(self.cells[x][y]):
+                self._link((x, y), number_id)
+
+    def _remove_number(self, number_id: int) -> None:
+        for symbol in list(self.number_symbols.get(number_id, ())):
+            self._unlink(symbol, number_id)
+
+        r, start, end, _ = self.numbers.pop(number_id)
+        labels = self.labels[r]
+        for col in range(start, end):
+            labels[col] = 0
+
+    def _add_symbol(self, symbol: Coordinate) -> None:
+        r, c = symbol
+        self.symbol_parts[symbol] = set()
+        for x, y in self._neighbours(r, c, c + 1):
+            if self.labels[x][y]:
+                self._link(symbol, self.labels[x][y])
+
+    def _remove_symbol(self, symbol: Coordinate) -> None:
+        for number_id in list(self.symbol_parts[symbol]):
+            self._unlink(symbol, number_id)
+        del self.symbol_parts[symbol]
+
+    def _link(self, symbol: Coordinate, number_id: int) -> None:
+        """
+        Adds a number to the index of a symbol, and updates the sums.
+        """
+        parts = self.symbol_parts[symbol]
+        if number_id in parts:
+            return
 
-                self.part_numbers.extend(curr_part_numbers)
+        self._update_gear(symbol, parts.add, number_id)
+        if number_id not in self.number_symbols:
+            self.number_symbols[number_id] = set()
+            self.part_number_sum += self.numbers[number_id][3]
+        self.number_symbols[number_id].add(symbol)
 
-    def _adjacent_coords(self, r: int, c: int) -> List[Tuple[int, int]]:
+    def _unlink(self, symbol: Coordinate, number_id: int) -> None:
         """
-        Returns a list of coordinates adjacent to (r, c) that are within the grid, including diagonals.
+        Removes a number from the index of a symbol, and updates the sums.
         """
-        return [
-            (r + dr, c + dc)
-            for dr in range(-1, 2)
-            for dc in range(-1, 2)
-            if (dr, dc) != (0, 0) and 0 <= r + dr < self.m and 0 <= c + dc < self.n
-        ]
-
-    def _construct_part_number(self, r: int, c: int) -> int:
+        self._update_gear(symbol, self.symbol_parts[symbol].discard, number_id)
+        symbols = self.number_symbols[number_id]
+        symbols.discard(symbol)
+        if not symbols:
+            del self.number_symbols[number_id]
+            self.part_number_sum -= self.numbers[number_id][3]
+
+    def _update_gear(
+        self, symbol: Coordinate, update: Callable[[int], None], number_id: int
+    ) -> None:
         """
-        Constructs the part number at (r, c) by finding the start and end of the part number.
+        Applies an update to the numbers of a symbol, and replaces its gear ratio in the sum.
         """
-        start = end = c
-        self.seen.add((r, c))
-
-        while start > 0 and self.grid[r][start - 1].isdigit():
-            start -= 1
-            self.seen.add((r, start))
+        self.gear_ratio_sum -= self._gear_ratio(symbol) or 0
+        update(number_id)
+        self.gear_ratio_sum += self._gear_ratio(symbol) or 0
 
-        while end + 1 < self.n and self.grid[r][end + 1].isdigit():
-            end += 1
-            self.seen.add((r, end))
+    def _gear_ratio(self, symbol: Coordinate) -> Optional[int]:
+        """
+        Returns the gear ratio of the symbol, or None if it is not a gear that touches exactly two numbers.
+        """
+        r, c = symbol
+        parts = self.symbol_parts[symbol]
+        if self.cells[r][c] != GEAR or len(parts) != 2:
+            return None
 
-        return int(self.grid[r][start : end + 1])
+        first, second = parts
+        return self.numbers[first][3] * self.numbers[second][3]
@@ -0,0 +1,153 @@
+"""
+A vectorised NumPy engine for the schematic, which labels every number of the grid with array operations.
+NumPy is optional, so this module is only imported by the solver's "numpy" engine.
+"""
+
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+DOT = ord(".")
+GEAR = ord("*")
+ZERO = ord("0")
+
+# The number of cells processed at once, which bounds the memory of the temporary arrays.
+BAND_CELLS = 1 << 22
+
+# The offsets of the cells of a 3x3 neighbourhood, including its center.
+NEIGHBOURHOOD = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
+
+
+class GridSchematic(NamedTuple):
+    part_numbers: np.ndarray
+    gear_ratios: np.ndarray
+
+    @property
+    def part_number_sum(self) -> int:
+        return int(self.part_numbers.sum())
+
+    @property
+    def gear_ratio_sum(self) -> int:
+        return int(self.gear_ratios.sum())
+
+
+def as_grid(data: bytes) -> np.ndarray:
+    """
+    Views the rows of the schematic as a 2D array of bytes, without copying them.
+    """
+    if not data:
+        return np.zeros((0, 0), dtype=np.uint8)
+    if not data.endswith(b"\n"):
+        data += b"\n"
+
+    stride = data.find(b"\n") + 1
+    cells = np.frombuffer(data, dtype=np.uint8)
+    if not stride or len(cells) % stride:
+        raise ValueError("the rows of the schematic must all have the same length")
+
+    # Leave out the line endings.
+    width = len(data[:stride].rstrip(b"\r\n"))
+    return cells.reshape(-1, stride)[:, :width]
+
+
+def label_numbers(padded: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Labels each run of digits of the grid with a number ID, counting from 1 in row-major order.
+    | Structure:
+    | - A run starts at each digit whose left neighbour is not a digit. The grid is padded, so runs never span rows.
+    | - The ID of each digit is the number of run starts up to it, in row-major order.
+    | - The value of each run is the sum of its digits scaled by the powers of ten of their distance to its end,
+        which is summed over all runs at once with reduceat. Numbers of up to 18 digits fit in int64.
+    :return: A tuple of (labels, values), where labels is 0 outside of numbers, and values[id] is the value of
+        the number with that ID (values[0] is 0)
+    """
+    digits = (padded - np.uint8(ZERO)) < 10
+    starts = digits.copy()
+    starts[:, 1:] &= ~digits[:, :-1]
+
+    labels = np.cumsum(starts.ravel(), dtype=np.int64).reshape(padded.shape)
+    labels[~digits] = 0
+
+    positions = np.flatnonzero(digits)
+    ids = labels.ravel()[positions]
+    run_starts = np.flatnonzero(starts.ravel()[positions])
+    run_ends = np.append(run_starts[1:], len(positions)) - 1
+
+    exponents = run_ends[ids - 1] - np.arange(len(positions))
+    scaled = (padded.ravel()[positions] - ZERO).astype(np.int64)
+    scaled *= np.power(10, exponents, dtype=np.int64)
+
+    values = np.zeros(len(run_starts) + 1, dtype=np.int64)
+    if len(run_starts):
+        values[1:] = np.add.reduceat(scaled, run_starts)
+    return labels, values
+
+
+def process_band(
+    cells: np.ndarray, first: int, last: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the part numbers and gear ratios of the rows first..last of the cells. The rows around them are
+    only used as neighbours, so that each band of the grid counts its own numbers and gears exactly once.
+    | Structure:
+    | - The neighbourhoods of the symbols are marked by shifting the symbol mask by one cell in each direction.
+        Every number with a digit in a marked cell is a part number.
+    | - The adjacency table of the gears holds the labels of the 3x3 neighbourhood of each gear. A gear is
+        adjacent to exactly two numbers if its sorted row has exactly two distinct non-zero labels.
+    :return: A tuple of (part numbers, gear ratios)
+    """
+    # Pad the grid with a border of periods, so that shifts and neighbourhoods never go out of bounds.
+    padded = np.full((cells.shape[0] + 2, cells.shape[1] + 2), DOT, dtype=np.uint8)
+    padded[1:-1, 1:-1] = cells
+    labels, values = label_numbers(padded)
+    core = slice(first + 1, last + 1)
+
+    symbols = (labels == 0) & (padded != DOT)
+    near = symbols.copy()
+    near[:, 1:] |= symbols[:, :-1]
+    near[:, :-1] |= symbols[:, 1:]
+    marked = near.copy()
+    marked[1:] |= near[:-1]
+    marked[:-1] |= near[1:]
+
+    part_ids = np.unique(labels[core][marked[core]])
+    part_numbers = values[part_ids[part_ids > 0]]
+
+    rows, cols = np.nonzero(padded[core] == GEAR)
+    rows += first + 1
+    table = np.stack([labels[rows + dr, cols + dc] for dr, dc in NEIGHBOURHOOD], axis=1)
+    table.sort(axis=1)
+
+    distinct = (table[:, 1:] != table[:, :-1]) & (table[:, 1:] > 0)
+    counts = distinct.sum(axis=1) + (table[:, 0] > 0)
+    table = table[counts == 2]
+
+    # The two labels of each gear are its largest one, and its smallest non-zero one.
+    smallest = np.where(table > 0, table, table[:, -1:]).min(axis=1)
+    gear_ratios = values[smallest] * values[table[:, -1]]
+
+    return part_numbers, gear_ratios
+
+
+def process_grid(grid: np.ndarray) -> GridSchematic:
+    """
+    Finds the part numbers and gear ratios of the grid, one band of rows at a time, so that the temporary arrays
+    take memory proportional to the band rather than the whole grid. Each band also sees the row above and below it.
+    """
+    height, width = grid.shape
+    band = max(1, BAND_CELLS // max(width, 1))
+
+    part_numbers, gear_ratios = [], []
+    for top in range(0, height, band):
+        bottom = min(top + band, height)
+        start, stop = max(top - 1, 0), min(bottom + 1, height)
+
+        parts, gears = process_band(grid[start:stop], top - start, bottom - start)
+        part_numbers.append(parts)
+        gear_ratios.append(gears)
+
+    empty = np.zeros(0, dtype=np.int64)
+    return GridSchematic(
+        np.concatenate(part_numbers or [empty]),
+        np.concatenate(gear_ratios or [empty]),
+    )
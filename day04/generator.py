@@ -0,0 +1,39 @@
+import random
+
+BASE_SIZE = 200
+
+NUMBERS = range(1, 100)
+WINNING_COUNT = 10
+CARD_COUNT = 25
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a deck with the given number of scratchcards.
+    Most cards have no matches, so that the number of won copies does not grow exponentially with the deck size.
+    As with real inputs, no card wins copies of cards past the end of the deck.
+    """
+    rng = random.Random(seed)
+    width = len(str(size))
+    lines = []
+
+    for card_id in range(1, size + 1):
+        winning = rng.sample(NUMBERS, WINNING_COUNT)
+        others = list(set(NUMBERS) - set(winning))
+
+        matches = 0 if rng.random() < 0.75 else rng.randint(1, 3)
+        matches = min(matches, size - card_id)
+
+        numbers = rng.sample(winning, matches) + rng.sample(
+            others, CARD_COUNT - matches
+        )
+        rng.shuffle(numbers)
+
+        lines.append(
+            f"Card {card_id:>{width}}: "
+            + " ".join(f"{num:>2}" for num in winning)
+            + " | "
+            + " ".join(f"{num:>2}" for num in numbers)
+        )
+
+    return "\n".join(lines) + "\n"
@@ -1,14 +1,13 @@
-import re
-from typing import List
+from typing import Iterable
 
 from advent_of_code_solver import BaseSolver
 
-from .utils import ScratchCard
+from .utils import Deck, ScratchCard
 
 
-def get_total_scratchcards(scratchcards: List[ScratchCard]) -> int:
+def get_total_scratchcards(matches: Iterable[int]) -> int:
     """
-    Calculates the total number of scratchcards that have been won.
+    Calculates the total number of scratchcards that have been won, given the number of matches of each card.
 
     | Intuition:
     | - The number of scratchcards doubles at each iteration.
@@ -18,45 +17,66 @@ def get_total_scratchcards(scratchcards: List[ScratchCard]) -> int:
         at the (i + matches + 1)-th iteration.
     |
     | Optimizations:
-    | - We can use a circular buffer of size (n + 1) to store the dp values,
-        since we at most need add curr to dp[i + n + 1].
+    | - We can use a circular buffer of size n to store the dp values, as long as n is larger than any
+        number of matches, since we at most need add curr to dp[i + n].
+    | - The buffer grows when a card has more matches than any card before it, so n does not need to be known
+        in advance, and the memory is bounded by the largest number of matches rather than the number of cards.
+    | - The scratchcards are only iterated once, so they can be streamed.
     """
-    n = len(scratchcards[0].winning_numbers) + 1
-    dp = [0] * n
+    dp, n, idx = [0], 1, 0
     total, curr = 0, 1
 
-    for idx, card in enumerate(scratchcards):
-        idx %= n
+    for card_matches in matches:
         curr -= dp[idx]
         dp[idx] = 0
         total += curr
 
-        matches = card.get_number_of_matches()
-        dp[(idx + matches + 1) % n] += curr
+        if card_matches >= n:
+            # Unroll the buffer so that it starts at the current iteration, and extend it.
+            dp = dp[idx:] + dp[:idx] + [0] * (card_matches + 1 - n)
+            n, idx = card_matches + 1, 0
+
+        dp[(idx + card_matches + 1) % n] += curr
+        idx = (idx + 1) % n
         curr *= 2
 
     return total
 
 
 class Solver(BaseSolver):
-    def parse_input(self, file):
-        result = []
+    ENGINES = ("python", "numpy")
 
-        for line in file.read().splitlines():
-            match = re.match(r"Card\s+\d+: ([\d|\s]+) \| ([\d|\s]+)", line)
-            before_pipe, after_pipe = match.groups()
-
-            winning_numbers = list(map(int, before_pipe.split()))
-            card_numbers = list(map(int, after_pipe.split()))
+    def parse_input(self, file):
+        data = file.read().encode()
+        if self.engine == "numpy":
+            # NumPy is optional, so it is only imported by its engine.
+            from .vectorised import parse_deck
 
-            result.append(ScratchCard(winning_numbers, card_numbers))
+            return parse_deck(data)
 
-        return result
+        return Deck.from_buffer(data)
 
     def solve_part1(self):
-        scratchcards: List[ScratchCard] = self.input
-        return sum(card.points for card in scratchcards)
+        deck: Deck = self.input
+        return deck.points()
 
     def solve_part2(self):
-        scratchcards: List[ScratchCard] = self.input
-        return get_total_scratchcards(scratchcards)
+        deck: Deck = self.input
+        return get_total_scratchcards(deck.matches)
+
+    def solve_stream(self, lines):
+        points = 0
+
+        def matches():
+            nonlocal points
+            for line in lines:
+                # Blank lines are skipped, as when the whole deck is parsed.
+                if not line.strip():
+                    continue
+
+                card = ScratchCard.from_line(line.encode())
+                points += card.points
+                yield card.matches
+
+        total = get_total_scratchcards(matches())
+        return points, total
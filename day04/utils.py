@@ -1,21 +1,95 @@
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List
+from functools import reduce
+from operator import or_
+from typing import Iterable, Tuple
+
+
+class NumberBits(dict):
+    """
+    Maps each number token to its bit, parsing each distinct token only once.
+    Scratchcard numbers are small (below 100 in every deck), so a bitmask of them fits in two machine words.
+    """
+
+    def __missing__(self, token: bytes) -> int:
+        bit = self[token] = 1 << int(token)
+        return bit
+
+
+NUMBER_BITS = NumberBits()
+
+
+def to_bitmask(tokens: Iterable[bytes]) -> int:
+    return reduce(or_, map(NUMBER_BITS.__getitem__, tokens), 0)
+
+
+def parse_card(line: bytes) -> Tuple[int, int]:
+    """
+    Parses a scratchcard line such as b"Card 1: 41 48 | 83 41".
+    :return: A tuple of (winning numbers, card numbers), as bitmasks
+    """
+    _, _, numbers = line.partition(b":")
+    winning, _, card = numbers.partition(b"|")
+    return to_bitmask(winning.split()), to_bitmask(card.split())
+
+
+def get_points(matches: int) -> int:
+    return 0 if matches == 0 else 1 << (matches - 1)
 
 
 @dataclass
 class ScratchCard:
-    winning_numbers: List[int]
-    card_numbers: List[int]
+    winning_mask: int
+    card_mask: int
 
     # Solution-specific attributes
+    matches: int = field(init=False)
     points: int = field(init=False)
 
     def __post_init__(self):
-        self.points = self._calculate_points()
+        self.matches = (self.winning_mask & self.card_mask).bit_count()
+        self.points = get_points(self.matches)
+
+    @classmethod
+    def from_line(cls, line: bytes) -> "ScratchCard":
+        return cls(*parse_card(line))
+
+
+@dataclass
+class Deck:
+    """
+    The number of matches of each scratchcard of a deck, which is all that both parts need.
+    The matches are computed once per card, and stored in a fixed-width array of 2 bytes per card.
+    """
+
+    matches: array = field(default_factory=lambda: array("H"))
+
+    @classmethod
+    def from_buffer(cls, data: bytes) -> "Deck":
+        """
+        Builds a deck from the raw bytes of all its scratchcards, without creating an object per card.
+        """
+        deck = cls()
+        append = deck.matches.append
+
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+
+            winning_mask, card_mask = parse_card(line)
+            append((winning_mask & card_mask).bit_count())
+
+        return deck
 
-    def get_number_of_matches(self) -> int:
-        return len(set(self.winning_numbers) & set(self.card_numbers))
+    def __len__(self) -> int:
+        return len(self.matches)
 
-    def _calculate_points(self) -> int:
-        matches = self.get_number_of_matches()
-        return 0 if matches == 0 else 1 << (matches - 1)
+    def points(self) -> int:
+        """
+        Sums the points of all the cards, grouping the cards with the same number of matches.
+        """
+        return sum(
+            count * get_points(matches)
+            for matches, count in Counter(self.matches).items()
+        )
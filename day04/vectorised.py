@@ -0,0 +1,125 @@
+"""
+A vectorised NumPy engine for the deck, which parses and scores every scratchcard with array operations.
+NumPy is optional, so this module is only imported by the solver's "numpy" engine.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .utils import Deck
+
+ZERO = ord("0")
+BLANK = ord(" ")
+
+# The number of cards processed at once, which bounds the memory of the temporary arrays.
+CHUNK_CARDS = 1 << 16
+
+# The largest number supported by the boolean matrices, which have a column per value.
+MAX_NUMBER = 1 << 12
+
+
+def as_rows(data: bytes) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Views the numbers of each card as a row of a 2D array of bytes, without copying them. Real decks have a fixed
+    layout, in which every line has the same length, and its colon and pipe at the same columns.
+    :return: A tuple of (rows, pipe column), where each row starts after the colon of its card,
+        or None if the deck does not have a fixed layout
+    """
+    if not data.endswith(b"\n"):
+        data += b"\n"
+
+    stride = data.find(b"\n") + 1
+    colon, pipe = data.find(b":", 0, stride), data.find(b"|", 0, stride)
+    cells = np.frombuffer(data, dtype=np.uint8)
+    if colon < 0 or pipe < colon or len(cells) % stride:
+        return None
+
+    rows = cells.reshape(-1, stride)
+    if not (rows[:, colon] == ord(":")).all() or not (rows[:, pipe] == ord("|")).all():
+        return None
+
+    # Leave out the line endings.
+    width = len(data[:stride].rstrip(b"\r\n"))
+    return rows[:, colon + 1 : width], pipe - colon - 1
+
+
+def count_matches(columns: np.ndarray, pipe: int) -> Optional[np.ndarray]:
+    """
+    Counts the matches of a chunk of cards, given the columns of their numbers, transposed so that each column
+    is contiguous.
+    | Structure:
+    | - Each run of columns that has a digit in any card is the span of one number. Every card must have
+        a right-aligned number in each span, whose value is that of its digits with blanks as leading zeros.
+    | - The winning and card numbers are marked in boolean matrices with a row per card and a column per value.
+        The matches of each card are the popcount of the AND of its two rows.
+    :return: The number of matches of each card, or None if the numbers of the cards are not in the same spans
+    """
+    blanks = columns == BLANK
+    blanks[pipe] = True
+    columns = columns - np.uint8(ZERO)
+    digits = columns < 10
+    if not (digits | blanks).all():
+        return None
+    columns[blanks] = 0
+
+    occupied = np.flatnonzero(digits.any(axis=1))
+    if not len(occupied):
+        return np.zeros(columns.shape[1], dtype=np.int64)
+
+    breaks = np.flatnonzero(np.diff(occupied) != 1)
+    starts = np.concatenate(([occupied[0]], occupied[breaks + 1]))
+    ends = np.concatenate((occupied[breaks], [occupied[-1]])) + 1
+
+    # A digit followed by a blank in the same span is a misaligned number.
+    inner = np.zeros(len(columns) - 1, dtype=bool)
+    for start, end in zip(starts, ends):
+        inner[start : end - 1] = True
+    misaligned = digits[:-1][inner] & blanks[1:][inner]
+    if not digits[ends - 1].all() or misaligned.any():
+        return None
+
+    widths = ends - starts
+    values = np.zeros((len(starts), columns.shape[1]), dtype=np.int64)
+    for offset in range(widths.max()):
+        spans = np.flatnonzero(widths > offset)
+        values[spans] *= 10
+        values[spans] += columns[starts[spans] + offset]
+
+    size = int(values.max()) + 1
+    if size > MAX_NUMBER:
+        return None
+
+    cards = np.arange(columns.shape[1])
+    winning = np.zeros((len(cards), size), dtype=bool)
+    for numbers in values[ends <= pipe]:
+        winning[cards, numbers] = True
+    card = np.zeros((len(cards), size), dtype=bool)
+    for numbers in values[starts > pipe]:
+        card[cards, numbers] = True
+
+    winning &= card
+    return np.count_nonzero(winning, axis=1)
+
+
+def parse_deck(data: bytes) -> Deck:
+    """
+    Builds a deck from the raw bytes of all its scratchcards, one chunk of cards at a time.
+    Decks without a fixed layout are parsed by the Python engine instead.
+    """
+    layout = as_rows(data)
+    if layout is None:
+        return Deck.from_buffer(data)
+
+    rows, pipe = layout
+    matches = []
+    for top in range(0, len(rows), CHUNK_CARDS):
+        columns = np.ascontiguousarray(rows[top : top + CHUNK_CARDS].T)
+        chunk = count_matches(columns, pipe)
+        if chunk is None:
+            return Deck.from_buffer(data)
+        matches.append(chunk.astype(np.uint16))
+
+    deck = Deck()
+    deck.matches.frombytes(np.concatenate(matches).tobytes())
+    return deck
@@ -0,0 +1,50 @@
+import random
+
+BASE_SIZE = 20
+
+CATEGORIES = (
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+)
+
+# Real inputs only use 32-bit values.
+UNIVERSE = 1 << 32
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates an almanac with the given number of seed ranges, and the given number of ranges in each map.
+    Each map is a permutation of the source category, as with real inputs.
+    """
+    rng = random.Random(seed)
+
+    seeds = []
+    for _ in range(size):
+        length = rng.randint(1, UNIVERSE // (4 * size))
+        seeds += [rng.randrange(UNIVERSE - length), length]
+
+    sections = ["seeds: " + " ".join(map(str, seeds))]
+
+    for src, dest in zip(CATEGORIES, CATEGORIES[1:]):
+        # Cut the universe into intervals, then shuffle the intervals to get their destinations.
+        cuts = sorted(rng.sample(range(1, UNIVERSE), size - 1))
+        bounds = list(zip([0] + cuts, cuts + [UNIVERSE]))
+        shuffled = bounds[:]
+        rng.shuffle(shuffled)
+
+        lines = []
+        dest_start = 0
+        for src_start, src_stop in shuffled:
+            lines.append(f"{dest_start} {src_start} {src_stop - src_start}")
+            dest_start += src_stop - src_start
+
+        rng.shuffle(lines)
+        sections.append(f"{src}-to-{dest} map:\n" + "\n".join(lines))
+
+    return "\n\n".join(sections) + "\n"
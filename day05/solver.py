@@ -3,15 +3,22 @@ from typing import List
 
 from advent_of_code_solver import BaseSolver
 
-from .utils import CategoryMapper, CategoryRange
+from .utils import CategoryMapper, CategoryRange, IntervalSet
 
 
 class Solver(BaseSolver):
+    ENGINES = ("python", "numpy")
+
     def parse_input(self, file):
         data = file.read().split("\n\n")
 
         seeds = re.findall(r"\d+", data[0])
         seeds = list(map(int, seeds))
+        if self.engine == "numpy":
+            # NumPy is optional, so it is only imported by its engine.
+            import numpy as np
+
+            seeds = np.array(seeds, dtype=np.int64)
 
         dummy_mapper = CategoryMapper([])
         for line in data[1:]:
@@ -25,19 +32,29 @@ class Solver(BaseSolver):
             mapper = CategoryMapper(ranges)
             dummy_mapper.set_next_mapper(mapper)
 
-        return seeds, dummy_mapper.next_mapper
+        return seeds, dummy_mapper.next_mapper.compile()
 
     def solve_part1(self):
-        seeds, base_mapper = self.input
-        return min(map(base_mapper.map, seeds))
+        seeds, table = self.input
+        if self.engine == "numpy":
+            from .vectorised import min_location
+
+            return min_location(table, seeds)
+
+        return min(map(table.map, seeds))
 
     def solve_part2(self):
-        seeds, base_mapper = self.input
+        seeds, table = self.input
         ranges: List[range] = []
 
         # convert seeds to seed ranges
         for idx in range(0, len(seeds), 2):
             ranges.append(range(seeds[idx], seeds[idx] + seeds[idx + 1]))
 
-        mapped_ranges = base_mapper.map_ranges(ranges)
-        return min(map(lambda r: r.start, mapped_ranges))
+        intervals = IntervalSet.from_ranges(ranges)
+        if self.engine == "numpy":
+            from .vectorised import min_image
+
+            return min_image(table, intervals)
+
+        return table.min_image(intervals)
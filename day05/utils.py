@@ -1,8 +1,11 @@
+from array import array
 from bisect import bisect_right
 from collections import deque
 from dataclasses import dataclass, field
 from functools import total_ordering
-from typing import List, Optional
+from heapq import heapify, heappop
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 
 @total_ordering
@@ -151,5 +154,234 @@ class CategoryMapper:
         """
         Finds the category range that contains the value.
         """
-        idx = bisect_right(self.category_ranges, CategoryRange(0, value, 0)) - 1
-        return self.category_ranges[idx]
+        idx = bisect_right(self.category_ranges, value, key=attrgetter("src_start"))
+        return self.category_ranges[idx - 1]
+
+    def compile(self) -> "PiecewiseMap":
+        """
+        Composes this mapper and the rest of the chain into a single piecewise map, one mapper at a time.
+        """
+        table = PiecewiseMap.from_category_ranges(self.category_ranges)
+        mapper = self.next_mapper
+        while mapper is not None:
+            table = table.then(
+                PiecewiseMap.from_category_ranges(mapper.category_ranges)
+            )
+            mapper = mapper.next_mapper
+        return table
+
+
+@dataclass
+class PiecewiseMap:
+    """
+    A piecewise-linear map, which adds offsets[i] to the values from starts[i] up to starts[i + 1].
+    The starts are sorted, the first one is 0, and the last piece is unbounded.
+    The table is stored in two fixed-width arrays of 64-bit integers, since the values can exceed 32 bits,
+    so it is pickled compactly by the parse cache, and can be saved with to_bytes.
+    """
+
+    TYPECODE = "q"
+
+    starts: array = field(default_factory=lambda: array(PiecewiseMap.TYPECODE))
+    offsets: array = field(default_factory=lambda: array(PiecewiseMap.TYPECODE))
+
+    @classmethod
+    def from_category_ranges(
+        cls, category_ranges: List[CategoryRange]
+    ) -> "PiecewiseMap":
+        """
+        Builds a map from the full category ranges of a mapper, which are sorted and have no gaps between them.
+        """
+        table = cls()
+        for category_range in category_ranges:
+            if category_range.range_len > 0:
+                offset = category_range.dest_start - category_range.src_start
+                table.append(category_range.src_start, offset)
+        return table
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PiecewiseMap":
+        table = cls()
+        table.starts.frombytes(data[: len(data) // 2])
+        table.offsets.frombytes(data[len(data) // 2 :])
+        return table
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialises the map as its starts followed by its offsets, in native byte order.
+        """
+        return self.starts.tobytes() + self.offsets.tobytes()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def append(self, start: int, offset: int) -> None:
+        """
+        Adds a piece after the last one, merging it into the last one if they have the same offset.
+        """
+        if self.offsets and self.offsets[-1] == offset:
+            return
+        self.starts.append(start)
+        self.offsets.append(offset)
+
+    def then(self, other: "PiecewiseMap") -> "PiecewiseMap":
+        """
+        Composes this map with another one, which maps the results of this map.
+
+        | Algorithm:
+        | - The image of each piece of this map is a contiguous interval, which overlaps a run of pieces of the other
+            map. Each overlap is a piece of the composed map, whose offset is the sum of the two offsets.
+        | - The pieces are found in increasing order, so the composed map is built in a single sweep.
+        """
+        table = type(self)()
+        bounds = list(self.starts[1:]) + [None]
+
+        for start, stop, offset in zip(self.starts, bounds, self.offsets):
+            idx = bisect_right(other.starts, start + offset) - 1
+            while True:
+                table.append(
+                    max(start, other.starts[idx] - offset), offset + other.offsets[idx]
+                )
+                idx += 1
+                if idx == len(other) or (
+                    stop is not None and other.starts[idx] - offset >= stop
+                ):
+                    break
+
+        return table
+
+    def pieces(self) -> Iterator[Tuple[int, Optional[int], int]]:
+        """
+        :return: The (start, stop, offset) of each piece, where the stop of the last piece is None
+        """
+        return zip(self.starts, list(self.starts[1:]) + [None], self.offsets)
+
+    def map(self, value: int) -> int:
+        return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+    def map_ranges(self, ranges: Iterable[range]) -> List[range]:
+        """
+        Maps ranges of values, splitting them at the starts of the pieces, in a single sweep over each range.
+        """
+        starts, offsets = self.starts, self.offsets
+        mapped_ranges = []
+
+        for r in combine_ranges(list(ranges)):
+            start = r.start
+            idx = bisect_right(starts, start) - 1
+            while start < r.stop:
+                stop = (
+                    r.stop if idx + 1 == len(starts) else min(r.stop, starts[idx + 1])
+                )
+                mapped_ranges.append(range(start + offsets[idx], stop + offsets[idx]))
+                start = stop
+                idx += 1
+
+        return mapped_ranges
+
+    def image(self, intervals: "IntervalSet") -> "IntervalSet":
+        """
+        Maps a set of values, by splitting its intervals at the starts of the pieces, shifting each part
+        by the offset of its piece, and merging the parts that overlap.
+        """
+        return IntervalSet.from_ranges(self.map_ranges(intervals.ranges()))
+
+    def preimage(self, intervals: "IntervalSet") -> "IntervalSet":
+        """
+        Finds the set of values that are mapped into a set, which inverts the map even where it is not one-to-one.
+        The image of each piece is an interval, whose overlaps with the set are shifted back by the offset.
+        """
+        ranges = []
+        for start, stop, offset in self.pieces():
+            image_stop = None if stop is None else stop + offset
+            for r in intervals.overlaps(start + offset, image_stop):
+                ranges.append(range(r.start - offset, r.stop - offset))
+        return IntervalSet.from_ranges(ranges)
+
+    def min_image(self, intervals: "IntervalSet") -> int:
+        """
+        Finds the lowest value of the image of a set, without mapping the whole set.
+
+        | Algorithm:
+        | - The image of each piece is a candidate interval of results. The candidates are popped from a heap
+            in the order of their lowest value, so that only the candidates that are walked are ordered.
+        | - Each candidate is walked backwards with preimage, to the values of the set that are mapped into it,
+            whose image holds the lowest value of the candidate.
+        | - Stop at the first candidate that starts above the best value, since no later candidate can beat it.
+        """
+        if not intervals:
+            raise ValueError("there are no values to map")
+
+        # The last piece is unbounded, but no value of the set is mapped past the end of the set.
+        last = intervals.stops[-1]
+        candidates = [
+            (start + offset, (last if stop is None else stop) + offset)
+            for start, stop, offset in self.pieces()
+        ]
+        heapify(candidates)
+
+        best = None
+        while candidates:
+            image_start, image_stop = heappop(candidates)
+            if best is not None:
+                if image_start >= best:
+                    break
+                image_stop = min(image_stop, best)
+
+            candidate = IntervalSet.from_ranges([range(image_start, image_stop)])
+            found = self.preimage(candidate).intersection(intervals)
+            if found:
+                best = self.image(found).starts[0]
+
+        return best
+
+
+@dataclass
+class IntervalSet:
+    """
+    A set of values, stored as sorted and disjoint half-open intervals with gaps between them,
+    in the same kind of arrays as a piecewise map.
+    """
+
+    starts: array = field(default_factory=lambda: array(PiecewiseMap.TYPECODE))
+    stops: array = field(default_factory=lambda: array(PiecewiseMap.TYPECODE))
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[range]) -> "IntervalSet":
+        intervals = cls()
+        for r in combine_ranges([r for r in ranges if r]):
+            intervals.starts.append(r.start)
+            intervals.stops.append(r.stop)
+        return intervals
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def ranges(self) -> List[range]:
+        return list(map(range, self.starts, self.stops))
+
+    def overlaps(self, start: int, stop: Optional[int]) -> Iterator[range]:
+        """
+        Yields the parts of the intervals between start and stop, where a stop of None is unbounded.
+        """
+        idx = bisect_right(self.stops, start)
+        while idx < len(self) and (stop is None or self.starts[idx] < stop):
+            yield range(
+                max(self.starts[idx], start),
+                self.stops[idx] if stop is None else min(self.stops[idx], stop),
+            )
+            idx += 1
+
+    def first_in(self, start: int, stop: Optional[int]) -> Optional[int]:
+        """
+        Finds the lowest value of the set between start and stop, where a stop of None is unbounded.
+        """
+        return next((r.start for r in self.overlaps(start, stop)), None)
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        Finds the values that are in both sets, by clipping the intervals of this set to each interval of the other.
+        """
+        return IntervalSet.from_ranges(
+            part for r in other.ranges() for part in self.overlaps(r.start, r.stop)
+        )
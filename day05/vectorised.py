@@ -0,0 +1,77 @@
+"""
+A vectorised NumPy engine for the almanac, which maps batches of seeds through the compiled piecewise map.
+NumPy is optional, so this module is only imported by the solver's "numpy" engine.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .utils import IntervalSet, PiecewiseMap
+
+# The number of values mapped at once, which bounds the memory of the temporary arrays.
+CHUNK_SIZE = 1 << 20
+
+
+def as_arrays(table: PiecewiseMap) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Views the starts and offsets of the map as int64 arrays, without copying them.
+    The values and offsets are at most 10 digits long, so their sums never overflow.
+    """
+    starts = np.frombuffer(table.starts, dtype=np.int64)
+    offsets = np.frombuffer(table.offsets, dtype=np.int64)
+    return starts, offsets
+
+
+def map_values(
+    table: PiecewiseMap, values: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Maps an array of values, by finding the piece of each value with a binary search over the starts,
+    and adding its offset.
+    """
+    starts, offsets = as_arrays(table)
+    values = np.asarray(values, dtype=np.int64)
+    idx = np.searchsorted(starts, values, side="right")
+    idx -= 1
+    return np.add(values, offsets[idx], out=out)
+
+
+def min_location(table: PiecewiseMap, seeds: np.ndarray) -> int:
+    """
+    Finds the lowest location of the seeds, mapping them one chunk at a time into a reused buffer.
+    """
+    seeds = np.asarray(seeds, dtype=np.int64)
+    buffer = np.empty(min(len(seeds), CHUNK_SIZE), dtype=np.int64)
+
+    lowest = None
+    for start in range(0, len(seeds), CHUNK_SIZE):
+        chunk = seeds[start : start + CHUNK_SIZE]
+        locations = map_values(table, chunk, out=buffer[: len(chunk)])
+        location = int(locations.min())
+        lowest = location if lowest is None else min(lowest, location)
+
+    if lowest is None:
+        raise ValueError("there are no seeds to map")
+    return lowest
+
+
+def min_image(table: PiecewiseMap, intervals: IntervalSet) -> int:
+    """
+    Finds the lowest value of the image of a set, by finding the lowest value of the set in every piece at once,
+    with a binary search of the start of each piece over the stops of the intervals.
+    """
+    piece_starts, offsets = as_arrays(table)
+    piece_stops = np.append(piece_starts[1:], np.iinfo(np.int64).max)
+    starts = np.frombuffer(intervals.starts, dtype=np.int64)
+    stops = np.frombuffer(intervals.stops, dtype=np.int64)
+    if not len(starts):
+        raise ValueError("there are no values to map")
+
+    # The first interval that ends after the start of each piece, if any, holds its lowest value.
+    idx = np.searchsorted(stops, piece_starts, side="right")
+    found = idx < len(stops)
+    lowest = np.maximum(starts[np.minimum(idx, len(stops) - 1)], piece_starts)
+    found &= lowest < piece_stops
+
+    return int((lowest + offsets)[found].min())
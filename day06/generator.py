@@ -0,0 +1,25 @@
+import random
+
+BASE_SIZE = 4
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a race sheet with the given number of races. Every race can be won in at least one way.
+    """
+    rng = random.Random(seed)
+    times, records = [], []
+
+    for _ in range(size):
+        time = rng.randint(7, 99)
+        times.append(time)
+        records.append(rng.randint(0, time * time // 4 - 1))
+
+    width = max(len(str(value)) for value in records)
+    return (
+        "Time:     "
+        + " ".join(f"{time:>{width}}" for time in times)
+        + "\nDistance: "
+        + " ".join(f"{record:>{width}}" for record in records)
+        + "\n"
+    )
@@ -1,9 +1,9 @@
 import re
 from collections import namedtuple
 from functools import reduce
-from math import ceil, floor, sqrt
+from math import isqrt
 from operator import mul
-from typing import List
+from typing import List, Sequence, Tuple
 
 from advent_of_code_solver import BaseSolver
 
@@ -19,24 +19,48 @@ def count_ways_to_beat_record(race: Race) -> int:
     | - x = speed to find, t = race time, r = race record
     | - we want to find x such that x * (t - x) > r
     | - rearrange to get x^2 - tx + r < 0, therefore a = 1, b = -t, c = r
+    |
+    | Exactness:
+    | - The roots are computed with integer square roots, so races of any size are exact, unlike with floats,
+        which lose precision past 2^53.
+    | - With s = isqrt(d), (t - s) // 2 is either the last speed before the low root, or the one after it,
+        so a single comparison finds the lowest winning speed.
+    | - The winning speeds are symmetric around t / 2, so the highest one is t minus the lowest one.
     """
 
-    b, c = -race.time, race.record
+    t, r = race.time, race.record
     # discriminant
-    d = b**2 - 4 * c
+    d = t * t - 4 * r
+    if d < 0:
+        return 0
 
-    # solve for roots
-    low_root = (-b - sqrt(d)) / 2.0
-    high_root = (-b + sqrt(d)) / 2.0
+    min_speed = (t - isqrt(d)) // 2
+    if min_speed * (t - min_speed) <= r:
+        min_speed += 1
 
-    # find the range of speeds that can beat the record
-    # if the root is an integer, we add/subtract 1 to find strictly greater/less than
-    min_speed = int(low_root) + 1 if int(low_root) == low_root else ceil(low_root)
-    max_speed = int(high_root) - 1 if int(high_root) == high_root else floor(high_root)
-    return max_speed - min_speed + 1
+    max_speed = t - min_speed
+    return max(max_speed - min_speed + 1, 0)
+
+
+def concatenate_digits(values: Sequence[int]) -> Tuple[int, int]:
+    """
+    Concatenates the decimal digits of the values into a single integer, without converting it from a string,
+    since Python limits the length of the strings that it converts to integers.
+    Each half is concatenated recursively, so the result takes a few large multiplications, rather than one
+    per value.
+    :return: A tuple of (concatenated value, number of digits)
+    """
+    if len(values) == 1:
+        return values[0], len(str(values[0]))
+
+    left, left_digits = concatenate_digits(values[: len(values) // 2])
+    right, right_digits = concatenate_digits(values[len(values) // 2 :])
+    return left * 10**right_digits + right, left_digits + right_digits
 
 
 class Solver(BaseSolver):
+    ENGINES = ("python", "numpy")
+
     def parse_input(self, file):
         times, records = file.read().splitlines()
         times = [int(x) for x in re.findall(r"\d+", times)]
@@ -46,12 +70,18 @@ class Solver(BaseSolver):
 
     def solve_part1(self):
         races: List[Race] = self.input
+        if self.engine == "numpy":
+            # NumPy is optional, so it is only imported by its engine.
+            from .vectorised import count_ways_to_beat_records
+
+            return reduce(mul, count_ways_to_beat_records(races).tolist())
+
         return reduce(mul, (count_ways_to_beat_record(race) for race in races))
 
     def solve_part2(self):
         races: List[Race] = self.input
-        concat_time = "".join(str(race.time) for race in races)
-        concat_record = "".join(str(race.record) for race in races)
+        concat_time, _ = concatenate_digits([race.time for race in races])
+        concat_record, _ = concatenate_digits([race.record for race in races])
 
-        new_race = Race(int(concat_time), int(concat_record))
+        new_race = Race(concat_time, concat_record)
         return count_ways_to_beat_record(new_race)
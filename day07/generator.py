@@ -0,0 +1,19 @@
+import random
+
+from .utils import ORDERING
+
+BASE_SIZE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a list of the given number of hands and their bids.
+    """
+    rng = random.Random(seed)
+    lines = []
+
+    for _ in range(size):
+        cards = "".join(rng.choices(ORDERING, k=5))
+        lines.append(f"{cards} {rng.randint(1, 1000)}")
+
+    return "\n".join(lines) + "\n"
@@ -1,31 +1,45 @@
-from typing import List
+from typing import Sequence
 
 from advent_of_code_solver import BaseSolver
 
-from .utils import CamelCard, CardHand, WildCardHand
+from .utils import Deck
 
 
-def get_total_winnings(cards: List[CamelCard]) -> int:
-    sorted_cards = sorted(cards)
-    return sum(rank * card.bid for rank, card in enumerate(sorted_cards, start=1))
+def get_total_winnings(keys: Sequence[int], bids: Sequence[int]) -> int:
+    """
+    Ranks the hands by their integer sort keys, and sums the bids weighted by the ranks.
+    Only the positions of the hands are sorted, so equal hands keep their order.
+    """
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return sum(rank * bids[idx] for rank, idx in enumerate(order, start=1))
 
 
 class Solver(BaseSolver):
-    def parse_input(self, file):
-        result = []
-
-        for line in file.read().splitlines():
-            cards, bid = line.split(" ")
-            hand = CardHand(cards)
-            result.append(CamelCard(hand, int(bid)))
+    ENGINES = ("python", "numpy")
 
-        return result
+    def parse_input(self, file):
+        return Deck.from_lines(file.read().splitlines())
 
     def solve_part1(self):
-        return get_total_winnings(self.input)
+        deck: Deck = self.input
+        return self.get_total_winnings(deck.keys, deck.bids)
 
     def solve_part2(self):
-        camel_wildcards = [
-            CamelCard(WildCardHand(card.hand.cards), card.bid) for card in self.input
-        ]
-        return get_total_winnings(camel_wildcards)
+        deck: Deck = self.input
+        return self.get_total_winnings(deck.wildcard_keys, deck.bids)
+
+    def get_total_winnings(self, keys: Sequence[int], bids: Sequence[int]) -> int:
+        if self.engine == "numpy":
+            # NumPy is optional, so it is only imported by its engine.
+            from . import vectorised
+
+            return vectorised.get_total_winnings(keys, bids)
+
+        return get_total_winnings(keys, bids)
+
+    def solve_stream(self, lines):
+        # Ranking needs every hand, so only the sort keys and the bids are kept, not the lines.
+        deck = Deck.from_lines(lines)
+        return get_total_winnings(deck.keys, deck.bids), get_total_winnings(
+            deck.wildcard_keys, deck.bids
+        )
@@ -0,0 +1,18 @@
+"""
+A vectorised NumPy engine for the hands, which ranks them by sorting an array of their integer sort keys.
+NumPy is optional, so this module is only imported by the solver's "numpy" engine.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+
+def get_total_winnings(keys: Sequence[int], bids: Sequence[int]) -> int:
+    """
+    Ranks the hands with a stable argsort of their keys, so that equal hands keep their order,
+    and sums the bids weighted by the ranks.
+    """
+    order = np.argsort(np.asarray(keys, dtype=np.int64), kind="stable")
+    ranks = np.arange(1, len(order) + 1, dtype=np.int64)
+    return int(np.asarray(bids, dtype=np.int64)[order] @ ranks)
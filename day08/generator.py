@@ -0,0 +1,68 @@
+import random
+from itertools import product
+from string import ascii_uppercase
+
+BASE_SIZE = 700
+
+MAX_GHOSTS = 6
+
+# The cycle length of each ghost is a multiple of a common length, so that the lengths share a factor, and the
+# ghosts meet at a time that is not just their lcm. The multipliers are pairwise coprime, so the ghosts can meet.
+MULTIPLIERS = (2, 3, 5, 7, 11, 13)
+
+# Node names are three uppercase letters. Names ending with "A" or "Z" are reserved for sources and destinations.
+INNER_NAMES = [
+    "".join(name) for name in product(ascii_uppercase, repeat=3) if name[-1] not in "AZ"
+]
+MAX_SIZE = len(INNER_NAMES)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a network with roughly the given number of nodes, which is capped by the three-letter node names.
+
+    | Structure:
+    | - Each ghost starts at a source node, walks a tail of inner nodes, then enters a cycle that contains exactly
+        one destination node, at a random position.
+    | - The cycle lengths are distinct multiples of a common length, and the tails are chosen so that every ghost
+        first reaches its destination at the same time modulo the common length, so that the ghosts do meet.
+    | - The first ghost starts at "AAA" and its destination is "ZZZ", so that the network is also valid for part 1.
+    """
+    if size > MAX_SIZE:
+        raise ValueError(f"size must be at most {MAX_SIZE}, got {size}")
+
+    rng = random.Random(seed)
+    ghosts = max(1, min(MAX_GHOSTS, size // 4))
+    multipliers = rng.sample(MULTIPLIERS, ghosts)
+    # Each ghost takes at most its cycle and a tail shorter than the common length.
+    common = max(1, size // (sum(multipliers) + ghosts))
+    residue = rng.randrange(common)
+
+    # Tiny networks can need a few more nodes than the given size, for the shortest cycles.
+    inner_names = iter(
+        rng.sample(INNER_NAMES, max(size, common * (sum(multipliers) + ghosts)))
+    )
+    prefixes = ["AA"] + rng.sample(
+        sorted({name[:2] for name in INNER_NAMES} - {"AA", "ZZ"}), ghosts - 1
+    )
+
+    lines = []
+    for prefix, multiplier in zip(prefixes, multipliers):
+        source, destination = prefix + "A", ("ZZ" if prefix == "AA" else prefix) + "Z"
+
+        # The destination is first reached after tail + position + 1 steps, which is the residue modulo common.
+        length = common * multiplier
+        position = rng.randrange(length)
+        tail = (residue - position - 1) % common
+
+        cycle = [next(inner_names) for _ in range(length - 1)]
+        cycle.insert(position, destination)
+        path = [next(inner_names) for _ in range(tail)] + cycle
+
+        lines.append(f"{source} = ({path[0]}, {path[0]})")
+        for curr, nxt in zip(path, path[1:] + cycle[:1]):
+            lines.append(f"{curr} = ({nxt}, {nxt})")
+
+    rng.shuffle(lines)
+    instructions = "".join(rng.choices("LR", k=rng.randint(2, 300)))
+    return instructions + "\n\n" + "\n".join(lines) + "\n"
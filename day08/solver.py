@@ -5,28 +5,29 @@ from advent_of_code_solver import BaseSolver
 
 from .utils import MultiStartNavigator, Node, SingleStartNavigator
 
-NETWORK: Dict[str, Node] = {}
-
 
 class Solver(BaseSolver):
     def parse_input(self, file):
         instructions, nodes = file.read().split("\n\n")
 
         # Construct the network dictionary
+        network: Dict[str, Node] = {}
         for line in nodes.splitlines():
             name, left, right = re.findall(r"[A-Z]{3}", line)
-            NETWORK[name] = Node(name, left, right)
+            network[name] = Node(name, left, right)
 
-        return instructions
+        return instructions, network
 
     def solve_part1(self):
-        navigator = SingleStartNavigator(self.input, NETWORK)
+        instructions, network = self.input
+        navigator = SingleStartNavigator(instructions, network)
         return navigator.get_steps_to_reach()
 
     def solve_part2(self):
-        nodes = list(NETWORK.keys())
+        instructions, network = self.input
+        nodes = list(network.keys())
         sources = [node for node in nodes if node[-1] == "A"]
         destinations = [node for node in nodes if node[-1] == "Z"]
 
-        navigator = MultiStartNavigator(self.input, NETWORK, sources, destinations)
+        navigator = MultiStartNavigator(instructions, network, sources, destinations)
         return navigator.get_steps_to_reach()
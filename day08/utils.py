@@ -1,14 +1,59 @@
+from array import array
 from collections import namedtuple
-from itertools import cycle
-from math import lcm
-from typing import Dict, List
+from math import gcd
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 Node = namedtuple("Node", ("name", "left", "right"))
 
 
+class Jump(NamedTuple):
+    """
+    The result of following the whole instruction string once from a node.
+    """
+
+    end: int  # The node ID after the last instruction
+    # The (number of steps, node ID) of each destination node that is reached, in order.
+    hits: Tuple[Tuple[int, int], ...]
+
+
+class GhostCycle(NamedTuple):
+    """
+    The times at which a ghost is at a destination node. From its offset on, the ghost repeats its states
+    with the given period, so its hits are given by their residues modulo the period.
+    """
+
+    offset: int
+    period: int
+    early_hits: FrozenSet[int]  # The hit times before the offset
+    residues: FrozenSet[int]  # The hit times from the offset on, modulo the period
+
+    def is_hit(self, time: int) -> bool:
+        if time < self.offset:
+            return time in self.early_hits
+        return time % self.period in self.residues
+
+
+def combine_congruences(a: int, m: int, b: int, n: int) -> Optional[Tuple[int, int]]:
+    """
+    Combines the congruences x = a (mod m) and x = b (mod n) with the generalised Chinese Remainder Theorem,
+    which does not need the moduli to be coprime.
+    :return: A tuple of (residue, modulus) of the combined congruence, or None if the congruences have no solution
+    """
+    g = gcd(m, n)
+    if (b - a) % g:
+        return None
+
+    # Solve a + m * k = b (mod n), by dividing it by g, where m // g is invertible modulo n // g.
+    k = (b - a) // g * pow(m // g, -1, n // g) % (n // g)
+    modulus = m // g * n
+    return (a + m * k) % modulus, modulus
+
+
 class SingleStartNavigator:
     """
     A class that navigates a network of nodes starting from a single source node.
+    The network is compiled to integer node IDs, with the IDs of the left and right neighbours of each node in arrays.
     """
 
     def __init__(self, instructions: str, network: Dict[str, Node]):
@@ -16,29 +61,63 @@ class SingleStartNavigator:
         self.network = network
         self.current_node = "AAA"
 
+        self.names = list(network)
+        self.ids = {name: node_id for node_id, name in enumerate(self.names)}
+        self.left = array("I", [self.ids[node.left] for node in network.values()])
+        self.right = array("I", [self.ids[node.right] for node in network.values()])
+
+        # The neighbour array of each instruction, so that a step is a single array lookup.
+        self.moves = [
+            self.left if direction == "L" else self.right for direction in instructions
+        ]
+
+        # The jump table, which is filled lazily, since only the nodes reached at the end of the instructions need it.
+        self.jumps: Dict[int, Jump] = {}
+        self.is_destination: Optional[bytearray] = None
+
     def get_steps_to_reach(self) -> int:
         """
         Returns the number of steps required to reach the destination node.
+        Each jump follows the whole instruction string at once, so a node that is reached again at the end of the
+        instructions reuses its jump. If the destination has not been reached after a jump from every node,
+        the navigation is in a loop that never reaches it.
         """
-        for steps, direction in enumerate(cycle(self.instructions), start=1):
-            self._update_node_position(direction)
+        node, steps = self.ids[self.current_node], 0
 
-            if self._has_reached_destination():
-                return steps
+        for _ in range(len(self.names) + 1):
+            jump = self._jump(node)
+            if jump.hits:
+                hit, hit_node = jump.hits[0]
+                self.current_node = self.names[hit_node]
+                return steps + hit
 
-    def _update_node_position(self, direction: str) -> None:
-        """
-        Updates the current node position based on the direction.
-        :param direction: Either "L" or "R"
-        """
-        node = self.network[self.current_node]
-        self.current_node = node.left if direction == "L" else node.right
+            node, steps = jump.end, steps + len(self.instructions)
 
-    def _has_reached_destination(self) -> bool:
+        raise ValueError("the destination node is never reached")
+
+    def _jump(self, node: int) -> Jump:
         """
-        Returns True if the current node is the destination node.
+        Follows the whole instruction string from a node, or looks it up in the jump table.
         """
-        return self.current_node == "ZZZ"
+        jump = self.jumps.get(node)
+        if jump is not None:
+            return jump
+
+        if self.is_destination is None:
+            self.is_destination = bytearray(map(self._is_destination, self.names))
+        is_destination = self.is_destination
+
+        curr, hits = node, []
+        for steps, move in enumerate(self.moves, start=1):
+            curr = move[curr]
+            if is_destination[curr]:
+                hits.append((steps, curr))
+
+        jump = self.jumps[node] = Jump(curr, tuple(hits))
+        return jump
+
+    def _is_destination(self, name: str) -> bool:
+        return name == "ZZZ"
 
 
 class MultiStartNavigator(SingleStartNavigator):
@@ -60,19 +139,72 @@ class MultiStartNavigator(SingleStartNavigator):
     def get_steps_to_reach(self) -> int:
         """
         Returns the number of steps required for all source nodes to reach the destination nodes at the same time.
-        The number of steps is the LCM of the number of steps required for each source node to reach the destination.
+
+        | Algorithm:
+        | 1. Find the cycle of each ghost, which starts at its offset, and the times at which it is at a destination.
+        | 2. Before the last ghost enters its cycle, all ghosts can only meet at one of the early hits of that ghost,
+             which are checked against the other ghosts in order.
+        | 3. Afterwards, every ghost is in its cycle, so the meeting times are the solutions of a congruence
+             per ghost, for each choice of one of its residues. They are combined with the generalised CRT,
+             and the answer is the earliest solution from the last offset on.
         """
-        steps_list = []
+        cycles = [self._find_cycle(self.ids[source]) for source in self.sources]
+        last = max(cycles, key=attrgetter("offset"))
+
+        for time in sorted(last.early_hits):
+            if all(cycle.is_hit(time) for cycle in cycles):
+                return time
+
+        congruences = {(0, 1)}
+        for cycle in cycles:
+            congruences = {
+                combined
+                for a, m in congruences
+                for b in cycle.residues
+                if (combined := combine_congruences(a, m, b, cycle.period)) is not None
+            }
+
+        if not congruences:
+            raise ValueError("the destination nodes are never reached at the same time")
+
+        start = max(last.offset, 1)
+        return min(
+            start + (residue - start) % modulus for residue, modulus in congruences
+        )
+
+    def _find_cycle(self, node: int) -> GhostCycle:
+        """
+        Finds the cycle of the ghost that starts at the node.
+        The state of a ghost is its node and its position in the instructions. At the start of the instructions,
+        it is only its node, so the states repeat as soon as a node is reached again at the end of a jump.
+        """
+        length = len(self.instructions)
+        passes: List[Jump] = []
+        seen: Dict[int, int] = {}  # The index of the pass that starts at each node
+
+        while node not in seen:
+            seen[node] = len(passes)
+            jump = self._jump(node)
+            passes.append(jump)
+            node = jump.end
 
-        for source_node in self.sources:
-            self.current_node = source_node
-            steps = super().get_steps_to_reach()
-            steps_list.append(steps)
+        start = seen[node]
+        offset, period = start * length, (len(passes) - start) * length
 
-        return lcm(*steps_list)
+        times = [
+            idx * length + steps
+            for idx, jump in enumerate(passes)
+            for steps, _ in jump.hits
+        ]
+        return GhostCycle(
+            offset,
+            period,
+            frozenset(time for time in times if time < offset),
+            frozenset(time % period for time in times if time >= offset),
+        )
 
-    def _has_reached_destination(self) -> bool:
+    def _is_destination(self, name: str) -> bool:
         """
-        Returns True if the current node is one of the destination nodes.
+        Returns True if the node is one of the destination nodes.
         """
-        return self.current_node in self.destinations
+        return name in self.destinations
@@ -0,0 +1,26 @@
+import random
+from itertools import accumulate
+
+BASE_SIZE = 200
+
+SEQUENCE_LENGTH = 21
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates an OASIS report with the given number of histories.
+    Each history is a polynomial sequence, built by repeatedly taking prefix sums of a constant sequence.
+    """
+    rng = random.Random(seed)
+    lines = []
+
+    for _ in range(size):
+        nums = [rng.randint(-5, 5)] * SEQUENCE_LENGTH
+        for _ in range(rng.randint(0, 6)):
+            nums = list(accumulate(nums, initial=rng.randint(-20, 20)))[
+                :SEQUENCE_LENGTH
+            ]
+
+        lines.append(" ".join(map(str, nums)))
+
+    return "\n".join(lines) + "\n"
@@ -24,3 +24,12 @@ class Solver(BaseSolver):
 
     def solve_part2(self):
         return sum(extrapolate(nums[::-1]) for nums in self.input)
+
+    def solve_stream(self, lines):
+        part1 = part2 = 0
+        for line in lines:
+            nums = list(map(int, line.split()))
+            part1 += extrapolate(nums)
+            part2 += extrapolate(nums[::-1])
+
+        return part1, part2
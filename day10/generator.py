@@ -0,0 +1,97 @@
+import random
+from math import isqrt
+from typing import List, Set, Tuple
+
+BASE_SIZE = 140 * 140
+
+# The pipe that connects each pair of directions. Directions are (dr, dc) offsets.
+UP, DOWN, LEFT, RIGHT = (-1, 0), (1, 0), (0, -1), (0, 1)
+PIPES = {
+    frozenset((UP, DOWN)): "|",
+    frozenset((LEFT, RIGHT)): "-",
+    frozenset((UP, RIGHT)): "L",
+    frozenset((UP, LEFT)): "J",
+    frozenset((DOWN, LEFT)): "7",
+    frozenset((DOWN, RIGHT)): "F",
+}
+
+
+def random_spanning_tree(n: int, rng: random.Random) -> List[Tuple[int, int, int, int]]:
+    """
+    Generates a random spanning tree of an n x n grid graph, using an iterative randomised DFS.
+    :return: A list of edges (r1, c1, r2, c2)
+    """
+    visited = {(0, 0)}
+    stk = [(0, 0)]
+    edges = []
+
+    while stk:
+        r, c = stk[-1]
+        neighbours = [
+            (r + dr, c + dc)
+            for dr, dc in (UP, DOWN, LEFT, RIGHT)
+            if 0 <= r + dr < n and 0 <= c + dc < n and (r + dr, c + dc) not in visited
+        ]
+        if not neighbours:
+            stk.pop()
+            continue
+
+        nr, nc = rng.choice(neighbours)
+        visited.add((nr, nc))
+        edges.append((r, c, nr, nc))
+        stk.append((nr, nc))
+
+    return edges
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a square pipe field with roughly the given number of tiles.
+
+    | Structure:
+    | - A random spanning tree is drawn on a coarse grid, where each coarse cell is a 2 x 2 block of tiles.
+        The tree is a simply connected region, so its outline is a loop that never touches itself.
+    | - The main loop is the outline of the tree, and the remaining tiles are filled with junk pipes.
+    | - The starting tile is a "7" or "|" pipe, since the solver assumes that the loop leaves it downwards.
+    """
+    rng = random.Random(seed)
+    n = max(isqrt(size) // 3, 1)
+
+    # Fill the region of the tree, with a stride of 3 so that blocks are separated by a wall of width 1.
+    region: Set[Tuple[int, int]] = set()
+    for r in range(n):
+        for c in range(n):
+            region |= {
+                (3 * r + 1 + dr, 3 * c + 1 + dc) for dr in (0, 1) for dc in (0, 1)
+            }
+    for r1, c1, r2, c2 in random_spanning_tree(n, rng):
+        r, c = 3 * max(r1, r2), 3 * max(c1, c2)
+        if r1 == r2:
+            region |= {(3 * r1 + 1, c), (3 * r1 + 2, c)}
+        else:
+            region |= {(r, 3 * c1 + 1), (r, 3 * c1 + 2)}
+
+    # The outline runs along the corners of the region tiles, which become the tiles of the pipe field.
+    connections = {}
+    for r, c in region:
+        for (dr, dc), a, b in (
+            (UP, (r, c), (r, c + 1)),
+            (DOWN, (r + 1, c), (r + 1, c + 1)),
+            (LEFT, (r, c), (r + 1, c)),
+            (RIGHT, (r, c + 1), (r + 1, c + 1)),
+        ):
+            if (r + dr, c + dc) not in region:
+                connections.setdefault(a, set()).add((b[0] - a[0], b[1] - a[1]))
+                connections.setdefault(b, set()).add((a[0] - b[0], a[1] - b[1]))
+
+    side = 3 * n + 2
+    grid = [rng.choices("|-LJ7F.....", k=side) for _ in range(side)]
+    for (r, c), directions in connections.items():
+        grid[r][c] = PIPES[frozenset(directions)]
+
+    start_r, start_c = rng.choice(
+        sorted(pos for pos in connections if grid[pos[0]][pos[1]] in "7|")
+    )
+    grid[start_r][start_c] = "S"
+
+    return "\n".join(map("".join, grid)) + "\n"
@@ -0,0 +1,29 @@
+import random
+from math import isqrt
+
+BASE_SIZE = 140 * 140
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a square galaxy image with roughly the given number of cells.
+    About 2% of the cells are galaxies, and about 5% of the rows and columns are empty.
+    """
+    rng = random.Random(seed)
+    n = max(isqrt(size), 2)
+    empty_rows = {r for r in range(n) if rng.random() < 0.05}
+    empty_cols = {c for c in range(n) if rng.random() < 0.05}
+
+    lines = []
+    for r in range(n):
+        row = [
+            (
+                "#"
+                if r not in empty_rows and c not in empty_cols and rng.random() < 0.02
+                else "."
+            )
+            for c in range(n)
+        ]
+        lines.append("".join(row))
+
+    return "\n".join(lines) + "\n"
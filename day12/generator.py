@@ -0,0 +1,23 @@
+import random
+
+BASE_SIZE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a condition record with the given number of rows.
+    Each row is built from a valid arrangement of damaged springs, then about half its springs are made unknown.
+    """
+    rng = random.Random(seed)
+    lines = []
+
+    for _ in range(size):
+        groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 5))]
+        springs = "." * rng.randint(0, 2)
+        for group in groups:
+            springs += "#" * group + "." * rng.randint(1, 3)
+
+        springs = "".join("?" if rng.random() < 0.5 else spring for spring in springs)
+        lines.append(f"{springs} {','.join(map(str, groups))}")
+
+    return "\n".join(lines) + "\n"
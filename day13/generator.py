@@ -0,0 +1,76 @@
+import random
+from typing import List
+
+BASE_SIZE = 100
+
+
+def count_reflections(rows: List[int], differences: int) -> List[int]:
+    """
+    Returns the reflection indices of the rows, where the mirrored rows differ by exactly the given number of bits.
+    """
+    result = []
+    for i in range(1, len(rows)):
+        pairs = zip(reversed(rows[:i]), rows[i:])
+        if sum((a ^ b).bit_count() for a, b in pairs) == differences:
+            result.append(i)
+    return result
+
+
+def to_nums(grid: List[List[str]]) -> List[int]:
+    return [int("".join(row).translate(str.maketrans(".#", "01")), 2) for row in grid]
+
+
+def generate_pattern(rng: random.Random) -> List[List[str]]:
+    """
+    Generates a pattern with an exact vertical reflection, and a horizontal reflection with a single smudge.
+    The smudge is placed in a column that is not mirrored by the vertical reflection, so that it stays exact.
+    """
+    while True:
+        # Use odd dimensions, so that every reflection leaves at least one row and column unmirrored.
+        m, n = rng.randrange(9, 18, 2), rng.randrange(9, 18, 2)
+        col_idx, row_idx = rng.randint(1, n - 1), rng.randint(1, m - 1)
+
+        grid = []
+        for r in range(m):
+            mirrored = 2 * row_idx - 1 - r
+            if row_idx <= r and mirrored >= 0:
+                grid.append(grid[mirrored][:])
+                continue
+
+            row = rng.choices(".#", k=n)
+            for c in range(col_idx, min(n, 2 * col_idx)):
+                row[c] = row[2 * col_idx - 1 - c]
+            grid.append(row)
+
+        # Place the smudge in a mirrored row, and a column that is not mirrored.
+        free_cols = [c for c in range(n) if not (0 <= 2 * col_idx - 1 - c < n)]
+        smudge_r = rng.randint(row_idx, min(m, 2 * row_idx) - 1)
+        smudge_c = rng.choice(free_cols)
+        grid[smudge_r][smudge_c] = "#" if grid[smudge_r][smudge_c] == "." else "."
+
+        # Retry if the random rows and columns form any other reflection by chance.
+        rows, cols = to_nums(grid), to_nums(list(map(list, zip(*grid))))
+        if (
+            count_reflections(rows, 0) == []
+            and count_reflections(rows, 1) == [row_idx]
+            and count_reflections(cols, 0) == [col_idx]
+            and count_reflections(cols, 1) == []
+        ):
+            return grid
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates the given number of patterns. Each pattern has exactly one reflection, and exactly one smudge that
+    creates a different reflection. Patterns are randomly transposed, so both orientations are covered.
+    """
+    rng = random.Random(seed)
+    patterns = []
+
+    for _ in range(size):
+        grid = generate_pattern(rng)
+        if rng.random() < 0.5:
+            grid = list(map(list, zip(*grid)))
+        patterns.append("\n".join(map("".join, grid)))
+
+    return "\n\n".join(patterns) + "\n"
@@ -0,0 +1,14 @@
+import random
+from math import isqrt
+
+BASE_SIZE = 100 * 100
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a square platform with roughly the given number of cells.
+    About 10% of the cells are cube-shaped rocks, and about 20% are rounded rocks.
+    """
+    rng = random.Random(seed)
+    n = max(isqrt(size), 2)
+    return "\n".join("".join(rng.choices("#OO.......", k=n)) for _ in range(n)) + "\n"
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from advent_of_code_solver import BaseSolver
 
@@ -7,6 +7,35 @@ from .utils import State, get_total_load, tilt_north
 CYCLE_COUNT = 1_000_000_000
 
 
+def get_target_state(
+    initial_state: State, tilted_north: Optional[List[List[str]]] = None
+) -> State:
+    """
+    Returns the state that we will reach after cycling the grid CYCLE_COUNT times.
+    :param tilted_north: The initial grid already tilted north, if it is known
+    """
+    prev_state: State = initial_state
+    next_state: State = prev_state.cycle(tilted_north)
+
+    # Stores a mapping of the state to its index in the list of states.
+    seen: Dict[State, int] = {prev_state: 0}
+    states: List[State] = [prev_state]
+
+    # Keep cycling until we find a state that we've seen before.
+    while next_state not in seen:
+        seen[next_state] = len(states)
+        states.append(next_state)
+        next_state = next_state.cycle()
+
+    # We find the cycle length by subtracting the index of the first occurrence of the repeated state
+    # from the index that the repeated state would have taken.
+    cycle_length = len(states) - seen[next_state]
+
+    # The target state is the state that we will reach after cycling the grid CYCLE_COUNT times.
+    target_idx = seen[next_state] + (CYCLE_COUNT - seen[next_state]) % cycle_length
+    return states[target_idx]
+
+
 class Solver(BaseSolver):
     def parse_input(self, file):
         grid: List[List[str]] = list(map(list, file.read().splitlines()))
@@ -18,25 +47,12 @@ class Solver(BaseSolver):
         return get_total_load(tilted_grid)
 
     def solve_part2(self):
-        prev_state: State = self.input
-        next_state: State = prev_state.cycle()
-
-        # Stores a mapping of the state to its token.
-        seen: Dict[State, int] = {prev_state: prev_state.token}
-        # Since the tokens start from 0, we can use a list to store the states in order.
-        states: List[State] = [prev_state]
-
-        # Keep cycling until we find a state that we've seen before.
-        while next_state not in seen:
-            seen[next_state] = next_state.token
-            states.append(next_state)
-            next_state = next_state.cycle()
-
-        # We find the cycle length by subtracting the token of the repeated state
-        # from the token of its first occurrence.
-        cycle_length = next_state.token - seen[next_state]
-
-        # The target state is the state that we will reach after cycling the grid CYCLE_COUNT times.
-        target_idx = seen[next_state] + (CYCLE_COUNT - seen[next_state]) % cycle_length
-        target_state = states[target_idx]
+        target_state = get_target_state(self.input)
         return get_total_load(target_state.grid)
+
+    def solve_both(self):
+        # Part 1 is the first tilt of the first cycle, so it is only done once.
+        initial_state = self.input
+        tilted_grid = tilt_north(initial_state.grid)
+        target_state = get_target_state(initial_state, tilted_grid)
+        return get_total_load(tilted_grid), get_total_load(target_state.grid)
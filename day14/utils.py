@@ -1,7 +1,6 @@
 from copy import deepcopy
 from dataclasses import dataclass, field
-from itertools import count
-from typing import List
+from typing import List, Optional
 
 
 def tilt_north(grid: List[List[str]]) -> List[List[str]]:
@@ -66,11 +65,9 @@ def rotate_clockwise(grid: List[List[str]]) -> List[List[str]]:
 @dataclass
 class State:
     """
-    A state of the grid. We use a token to keep track of the state's position in the cycle.
+    A state of the grid.
     """
 
-    # A unique token for each state, starting from 0.
-    token: int = field(init=False, default_factory=count().__next__)
     grid: List[List[str]]
 
     # Cache the string representation of the grid.
@@ -87,15 +84,16 @@ class State:
     def __eq__(self, other):
         return str(self) == str(other)
 
-    def cycle(self) -> "State":
+    def cycle(self, tilted_north: Optional[List[List[str]]] = None) -> "State":
         """
         Tilts the grid north, west, south, and east, which forms a cycle.
+        :param tilted_north: The grid already tilted north, if it is known, so that the first tilt can be skipped
         :return:
         """
         grid = self.grid
-        for _ in range(4):
+        for i in range(4):
             # We tilt the grid north, then rotate it clockwise, which is equivalent to tilting the grid anticlockwise.
-            grid = tilt_north(grid)
+            grid = tilted_north if i == 0 and tilted_north else tilt_north(grid)
             grid = rotate_clockwise(grid)
 
         return State(grid)
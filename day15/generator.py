@@ -0,0 +1,25 @@
+import random
+from string import ascii_lowercase
+
+BASE_SIZE = 4000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates an initialization sequence with the given number of steps.
+    Labels are drawn from a pool that is a quarter of the size, so that lenses are replaced and removed.
+    """
+    rng = random.Random(seed)
+    labels = [
+        "".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(1, size // 4))
+    ]
+
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(
+            f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        )
+
+    return ",".join(steps) + "\n"
@@ -0,0 +1,15 @@
+import random
+from math import isqrt
+
+BASE_SIZE = 110 * 110
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a square contraption with roughly the given number of tiles.
+    About 10% of the tiles are mirrors or splitters.
+    """
+    rng = random.Random(seed)
+    n = max(isqrt(size), 2)
+    tiles = "/\\|-" + "." * 36
+    return "\n".join("".join(rng.choices(tiles, k=n)) for _ in range(n)) + "\n"
@@ -1,4 +1,4 @@
-from multiprocessing import Pool, cpu_count
+import os
 
 from advent_of_code_solver import BaseSolver
 
@@ -14,6 +14,8 @@ def process_row(starting_position, grid):
 
 
 class Solver(BaseSolver):
+    PROCESSES = os.cpu_count()
+
     def parse_input(self, file):
         return BeamGrid(file.read().splitlines())
 
@@ -31,7 +33,10 @@ class Solver(BaseSolver):
             + [(grid.m - 1, c, U) for c in range(grid.n)]
         )
 
-        with Pool(cpu_count()) as pool:
+        # multiprocessing is slow to import, so it is only imported when part 2 is actually solved
+        from multiprocessing import Pool
+
+        with Pool(self.PROCESSES) as pool:
             results = pool.starmap(
                 process_row, [(pos, grid) for pos in starting_positions]
             )
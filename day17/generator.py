@@ -0,0 +1,13 @@
+import random
+from math import isqrt
+
+BASE_SIZE = 141 * 141
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a square map of heat losses with roughly the given number of blocks.
+    """
+    rng = random.Random(seed)
+    n = max(isqrt(size), 5)
+    return "\n".join("".join(rng.choices("123456789", k=n)) for _ in range(n)) + "\n"
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from heapq import heappop, heappush
 from typing import List
 
+import instrumentation
+
 # Represent the four directions as integers
 U = 0
 L = 1
@@ -44,6 +46,7 @@ class CityMap:
         """
         seen = set()
         heap = [(0, 0, 0, -1)]
+        pushes = 0
 
         while heap:
             # cost: The cost incurred so far
@@ -55,6 +58,7 @@ class CityMap:
                 continue
 
             if self.is_goal(r, c):
+                instrumentation.count("day17.heap_pushes", pushes)
                 return cost
 
             seen.add((r, c, d))
@@ -76,3 +80,4 @@ class CityMap:
                     # and the new position has not been visited
                     if step >= min_steps and (nr, nc, nd) not in seen:
                         heappush(heap, (cost + add_cost, nr, nc, nd))
+                        pushes += 1
@@ -0,0 +1,119 @@
+import random
+from itertools import accumulate
+from math import isqrt
+from typing import Dict, List, Set, Tuple
+
+BASE_SIZE = 700
+
+# The direction of each (dr, dc) offset, and its encoding in the hexadecimal instructions.
+DIRECTIONS = {(-1, 0): "U", (1, 0): "D", (0, -1): "L", (0, 1): "R"}
+ENCODING = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+
+def random_tree_region(n: int, rng: random.Random) -> Set[Tuple[int, int]]:
+    """
+    Generates a simply connected region from a random spanning tree of an n x n grid graph.
+    Tree nodes and edges become cells with a stride of 2, so the outline of the region never touches itself.
+    """
+    region = {(1, 1)}
+    stk = [(0, 0)]
+
+    while stk:
+        r, c = stk[-1]
+        neighbours = [
+            (r + dr, c + dc)
+            for dr, dc in DIRECTIONS
+            if 0 <= r + dr < n
+            and 0 <= c + dc < n
+            and (2 * (r + dr) + 1, 2 * (c + dc) + 1) not in region
+        ]
+        if not neighbours:
+            stk.pop()
+            continue
+
+        nr, nc = rng.choice(neighbours)
+        region |= {(r + nr + 1, c + nc + 1), (2 * nr + 1, 2 * nc + 1)}
+        stk.append((nr, nc))
+
+    return region
+
+
+def trace_outline(region: Set[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Traces the outline of the region along the corners of its cells.
+    :return: The corners where the outline turns, in order
+    """
+    connections: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+    for r, c in region:
+        for (dr, dc), a, b in (
+            ((-1, 0), (r, c), (r, c + 1)),
+            ((1, 0), (r + 1, c), (r + 1, c + 1)),
+            ((0, -1), (r, c), (r + 1, c)),
+            ((0, 1), (r, c + 1), (r + 1, c + 1)),
+        ):
+            if (r + dr, c + dc) not in region:
+                connections.setdefault(a, []).append(b)
+                connections.setdefault(b, []).append(a)
+
+    start = min(connections)
+    outline = [start]
+    prev, curr = start, connections[start][0]
+    while curr != start:
+        outline.append(curr)
+        prev, curr = curr, next(p for p in connections[curr] if p != prev)
+
+    # Only keep the corners where the outline turns.
+    return [
+        p
+        for i, p in enumerate(outline)
+        if (outline[i - 1][0] == p[0]) != (p[0] == outline[(i + 1) % len(outline)][0])
+    ]
+
+
+def to_instructions(
+    corners: List[Tuple[int, int]], scale: List[int]
+) -> List[Tuple[str, int]]:
+    """
+    Converts the corners to a list of (direction, metres) instructions, after mapping each coordinate through
+    the given strictly increasing scale. The scale stretches the outline without making it touch itself.
+    """
+    result = []
+    for (r1, c1), (r2, c2) in zip(corners, corners[1:] + corners[:1]):
+        dr, dc = (r2 > r1) - (r2 < r1), (c2 > c1) - (c2 < c1)
+        metres = abs(scale[r2] - scale[r1]) + abs(scale[c2] - scale[c1])
+        result.append((DIRECTIONS[(dr, dc)], metres))
+    return result
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a dig plan with roughly the given number of instructions.
+    Both the plain and the hexadecimal instructions trace the same random simple polygon,
+    stretched by different scales, so that the plan is valid for both parts.
+    The polygon is traced clockwise, which the solver assumes.
+    """
+    rng = random.Random(seed)
+    n = max(isqrt(size // 2), 1)
+    corners = trace_outline(random_tree_region(n, rng))
+
+    # The solver expects a clockwise polygon, which has a negative determinant sum.
+    if (
+        sum(
+            r1 * c2 - r2 * c1
+            for (r1, c1), (r2, c2) in zip(corners, corners[1:] + corners[:1])
+        )
+        > 0
+    ):
+        corners.reverse()
+
+    small_scale = list(accumulate(rng.randint(1, 6) for _ in range(2 * n + 2)))
+    large_scale = list(accumulate(rng.randint(1, 50_000) for _ in range(2 * n + 2)))
+
+    lines = []
+    for (direction, metres), (hex_direction, hex_metres) in zip(
+        to_instructions(corners, small_scale), to_instructions(corners, large_scale)
+    ):
+        colour = f"{hex_metres:05x}{ENCODING[hex_direction]}"
+        lines.append(f"{direction} {metres} (#{colour})")
+
+    return "\n".join(lines) + "\n"
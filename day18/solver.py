@@ -1,6 +1,6 @@
 from collections import namedtuple
-from itertools import pairwise
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Iterable
 
 from advent_of_code_solver import BaseSolver
 
@@ -46,42 +46,56 @@ def get_num_interior_points(area: int, perimeter: int) -> int:
     return area - perimeter // 2 + 1
 
 
-def get_coordinates(instructions: List[Instruction]) -> List[Tuple[int, int]]:
+@dataclass
+class Lagoon:
     """
-    Converts a list of instructions to a list of coordinates.
+    Digs the lagoon one instruction at a time, so that the instructions can be streamed.
     """
-    # Use complex numbers to represent coordinates.
-    curr = 0 + 0j
-    coords = [to_coord(curr)]
 
-    for direction, metres, _ in instructions:
-        curr += OFFSETS[direction] * metres
-        coords.append(to_coord(curr))
+    # The current position. Use complex numbers to represent coordinates.
+    curr: complex = 0 + 0j
 
-    return coords
+    # Twice the signed area of the polygon dug so far, using the shoelace formula.
+    double_area: int = 0
+    perimeter: int = 0
 
+    def dig(self, instruction: Instruction) -> None:
+        """
+        Digs the trench of a single instruction.
+        """
+        nxt = self.curr + OFFSETS[instruction.direction] * instruction.metres
+        self.double_area += determinant(*to_coord(self.curr), *to_coord(nxt))
+        self.perimeter += instruction.metres
+        self.curr = nxt
 
-def get_total_lagoon_area(instructions: List[Instruction]) -> int:
+    @property
+    def total_area(self) -> int:
+        """
+        The total area of the lagoon, once the trench has been dug back to the start.
+        """
+        # The area is negated as calculating the area of a clockwise polygon gives a negative result.
+        area = -self.double_area // 2
+
+        interior_points = get_num_interior_points(area, self.perimeter)
+        return interior_points + self.perimeter
+
+
+def get_total_lagoon_area(instructions: Iterable[Instruction]) -> int:
     """
     Calculates the total area of the lagoon, given a list of instructions.
 
     | Algorithm:
-    | 1. Convert the instructions to a list of coordinates.
+    | 1. Follow the instructions to get the coordinates of each corner.
     | 2. Calculate the area of the polygon using the shoelace formula,
          and the perimeter by summing the instruction metres.
     | 3. Use Pick's theorem to calculate the number of interior points.
     | 4. The total area is the sum of the interior points and the perimeter.
     """
-    coords = get_coordinates(instructions)
-    perimeter = sum(instruction.metres for instruction in instructions)
-
-    # Use the shoelace formula to calculate the area of the polygon.
-    # The area is negated as calculating the area of a clockwise polygon gives a negative result.
-    area = sum(determinant(*pair[0], *pair[1]) for pair in pairwise(coords))
-    area = -area // 2
+    lagoon = Lagoon()
+    for instruction in instructions:
+        lagoon.dig(instruction)
 
-    interior_points = get_num_interior_points(area, perimeter)
-    return interior_points + perimeter
+    return lagoon.total_area
 
 
 def convert_instruction(instruction: Instruction) -> Instruction:
@@ -93,13 +107,14 @@ def convert_instruction(instruction: Instruction) -> Instruction:
     return Instruction(direction, metres, None)
 
 
+def parse_instruction(line: str) -> Instruction:
+    direction, metres, hex_value = line.split(" ")
+    return Instruction(direction, int(metres), hex_value[2:-1])
+
+
 class Solver(BaseSolver):
     def parse_input(self, file):
-        result = []
-        for line in file.read().splitlines():
-            direction, metres, hex_value = line.split(" ")
-            result.append(Instruction(direction, int(metres), hex_value[2:-1]))
-        return result
+        return [parse_instruction(line) for line in file.read().splitlines()]
 
     def solve_part1(self):
         return get_total_lagoon_area(self.input)
@@ -107,3 +122,12 @@ class Solver(BaseSolver):
     def solve_part2(self):
         instructions = list(map(convert_instruction, self.input))
         return get_total_lagoon_area(instructions)
+
+    def solve_stream(self, lines):
+        lagoon, hex_lagoon = Lagoon(), Lagoon()
+        for line in lines:
+            instruction = parse_instruction(line)
+            lagoon.dig(instruction)
+            hex_lagoon.dig(convert_instruction(instruction))
+
+        return lagoon.total_area, hex_lagoon.total_area
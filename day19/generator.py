@@ -0,0 +1,54 @@
+import random
+from collections import deque
+from itertools import count, product
+from string import ascii_lowercase
+
+BASE_SIZE = 500
+
+ATTRIBUTES = "xmas"
+
+
+def workflow_names():
+    """
+    Yields unique lowercase workflow names, skipping the reserved start workflow.
+    """
+    for length in count(2):
+        for name in product(ascii_lowercase, repeat=length):
+            if "".join(name) != "in":
+                yield "".join(name)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates the given number of workflows and the given number of parts.
+    The workflows form a tree rooted at "in", built breadth first so that its depth is logarithmic.
+    """
+    rng = random.Random(seed)
+    names = workflow_names()
+    queue = deque(["in"])
+    remaining = size - 1
+    workflows = []
+
+    while queue:
+        name = queue.popleft()
+        targets = []
+        for _ in range(rng.randint(2, 4)):
+            if remaining > 0:
+                targets.append(next(names))
+                queue.append(targets[-1])
+                remaining -= 1
+            else:
+                targets.append(rng.choice("AR"))
+
+        rules = [
+            f"{rng.choice(ATTRIBUTES)}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}"
+            for target in targets[:-1]
+        ]
+        workflows.append(f"{name}{{{','.join(rules + targets[-1:])}}}")
+
+    rng.shuffle(workflows)
+    parts = [
+        "{" + ",".join(f"{attr}={rng.randint(1, 4000)}" for attr in ATTRIBUTES) + "}"
+        for _ in range(size)
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
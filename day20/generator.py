@@ -0,0 +1,58 @@
+import random
+from itertools import product
+from string import ascii_lowercase
+
+BASE_SIZE = 48
+
+COUNTER_BITS = 12
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a module configuration with roughly the given number of flip-flops,
+    using the same structure as real inputs, which the solver relies on for part 2.
+
+    | Structure:
+    | - The broadcaster feeds several 12-bit binary counters, each made of a chain of flip-flops.
+    | - Each counter has a conjunction that resets the counter when it reaches a random value N,
+        by reading the flip-flops for the set bits of N and writing to the flip-flops for the unset bits.
+    | - Each counter's conjunction feeds an inverter, and all the inverters feed "nc", which feeds "rx".
+    """
+    rng = random.Random(seed)
+    counters = max(1, size // COUNTER_BITS)
+    pool = [
+        "".join(name)
+        for length in (2, 3)
+        for name in product(ascii_lowercase, repeat=length)
+        if "".join(name) not in ("nc", "rx")
+    ]
+    names = iter(rng.sample(pool, counters * (COUNTER_BITS + 2)))
+
+    lines = []
+    firsts, inverters = [], []
+    for _ in range(counters):
+        flip_flops = [next(names) for _ in range(COUNTER_BITS)]
+        hub, inverter = next(names), next(names)
+        firsts.append(flip_flops[0])
+        inverters.append(inverter)
+
+        # N is odd and has its top bit set, so that the first and last flip-flops both feed the hub.
+        n = rng.randrange(1 << (COUNTER_BITS - 1), 1 << COUNTER_BITS) | 1
+        hub_outputs = [flip_flops[0]]
+
+        for bit, flip_flop in enumerate(flip_flops):
+            outputs = flip_flops[bit + 1 : bit + 2]
+            if n >> bit & 1:
+                outputs.append(hub)
+            else:
+                hub_outputs.append(flip_flop)
+            lines.append(f"%{flip_flop} -> {', '.join(outputs)}")
+
+        hub_outputs.append(inverter)
+        lines.append(f"&{hub} -> {', '.join(hub_outputs)}")
+        lines.append(f"&{inverter} -> nc")
+
+    lines.append("&nc -> rx")
+    lines.append(f"broadcaster -> {', '.join(firsts)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from math import lcm
 from typing import Deque, Dict, List
 
+import instrumentation
+
 # Constants for the signal values
 HIGH = 1
 LOW = 0
@@ -92,11 +94,10 @@ class ModuleHandler:
     A class that handles the modules and their signals.
     """
 
-    BUTTON_PRESSES = 0
-
     def __init__(self, configurations: List[Configuration]):
         self.modules = {}
         self.signals = {LOW: 0, HIGH: 0}
+        self.button_presses = 0
         self._build_modules(configurations)
 
         # For part 2, we need to keep track of the pulses that we have sent to the module named rx.
@@ -110,20 +111,24 @@ class ModuleHandler:
         q: Deque[Pulse] = deque()
         q.append(Pulse(None, "broadcaster", LOW))
 
-        ModuleHandler.BUTTON_PRESSES += 1
+        self.button_presses += 1
+        pulses = 0
 
         while q:
             # Process the next pulse in the queue
             pulse = q.popleft()
             self.signals[pulse.signal] += 1
+            pulses += 1
 
             # Notify the pulse tracker of the current pulse
-            self.pulse_tracker.notify(pulse)
+            self.pulse_tracker.notify(pulse, self.button_presses)
 
             # Send the pulse to the destination modules
             for pulse in self.modules[pulse.dst].process_pulse(pulse):
                 q.append(pulse)
 
+        instrumentation.count("day20.pulses", pulses)
+
     def calculate_rx_presses_required(self) -> int:
         """
         Calculate the minimum number of button presses required to deliver a single low pulse to the 'rx' module.
@@ -188,9 +193,9 @@ class PulseTracker:
     def track_pulse(self, pulse: Pulse) -> None:
         self.tracked.add(pulse)
 
-    def notify(self, pulse: Pulse) -> None:
+    def notify(self, pulse: Pulse, button_presses: int) -> None:
         if pulse in self.tracked:
-            self.tracked_counts[pulse] = ModuleHandler.BUTTON_PRESSES
+            self.tracked_counts[pulse] = button_presses
             self.tracked.remove(pulse)
 
     def all_pulses_tracked(self) -> bool:
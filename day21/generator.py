@@ -0,0 +1,19 @@
+import random
+from math import isqrt
+
+BASE_SIZE = 131 * 131
+
+# Part 1 walks 64 steps from the centre, so the garden must be large enough to contain them.
+MIN_SIDE = 131
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a square garden with roughly the given number of plots, with the starting position at its centre.
+    About 10% of the plots are rocks.
+    """
+    rng = random.Random(seed)
+    n = max(isqrt(size), MIN_SIDE) | 1
+    grid = [rng.choices("#.........", k=n) for _ in range(n)]
+    grid[n // 2][n // 2] = "S"
+    return "\n".join(map("".join, grid)) + "\n"
@@ -0,0 +1,36 @@
+import random
+
+BASE_SIZE = 1200
+
+# Bricks are placed on a 10 x 10 footprint, as with real inputs.
+FOOTPRINT = 10
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a snapshot of the given number of falling bricks.
+    Bricks are stacked one at a time above the highest brick under their footprint, so they never overlap,
+    then listed in a random order.
+    """
+    rng = random.Random(seed)
+    heights = [[0] * FOOTPRINT for _ in range(FOOTPRINT)]
+    lines = []
+
+    for _ in range(size):
+        length = rng.randint(1, 4)
+        axis = rng.choice("xyz")
+        dx, dy, dz = (length - 1 if axis == a else 0 for a in "xyz")
+        x, y = rng.randrange(FOOTPRINT - dx), rng.randrange(FOOTPRINT - dy)
+
+        top = max(
+            heights[i][j] for i in range(x, x + dx + 1) for j in range(y, y + dy + 1)
+        )
+        z = top + 1 + (rng.random() < 0.1)
+        for i in range(x, x + dx + 1):
+            for j in range(y, y + dy + 1):
+                heights[i][j] = z + dz
+
+        lines.append(f"{x},{y},{z}~{x + dx},{y + dy},{z + dz}")
+
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
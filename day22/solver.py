@@ -1,5 +1,6 @@
 import re
 from collections import defaultdict, deque
+from functools import cached_property
 from typing import Dict, List, Set
 
 from advent_of_code_solver import BaseSolver
@@ -99,11 +100,17 @@ class Solver(BaseSolver):
         # Sort the bricks by their initial z value, so that the falling bricks can be processed in order
         return sorted(result, key=lambda brick: brick.z_range.start)
 
-    def solve_part1(self):
+    @cached_property
+    def settled_bricks(self) -> List[Brick]:
+        """
+        The bricks after they have fallen. Computed once, so that each part can be solved on its own.
+        """
         bricks: List[Brick] = self.input
-
-        # Handle the falling of bricks
         handle_falling(bricks)
+        return bricks
+
+    def solve_part1(self):
+        bricks = self.settled_bricks
 
         # Get the set of immovable bricks
         immovable = get_immovable_bricks(bricks)
@@ -112,5 +119,11 @@ class Solver(BaseSolver):
         return len(set(bricks) - immovable)
 
     def solve_part2(self):
-        bricks: List[Brick] = self.input
+        bricks = self.settled_bricks
         return sum(count_falling_bricks(brick) for brick in bricks)
+
+    def solve_both(self):
+        # A brick can be safely removed exactly when removing it makes no other bricks fall,
+        # so both parts can be answered from the same fall counts.
+        fall_counts = [count_falling_bricks(brick) for brick in self.settled_bricks]
+        return fall_counts.count(0), sum(fall_counts)
@@ -0,0 +1,72 @@
+import random
+from math import isqrt
+
+BASE_SIZE = 141 * 141
+
+# The junctions form a fixed 5 x 5 lattice, since part 2 is exponential in the number of junctions.
+JUNCTIONS = 5
+MIN_SPACING = 4
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a square hiking map with roughly the given number of tiles.
+
+    | Structure:
+    | - The junctions form a 5 x 5 lattice from the top-left to the bottom-right corner of the map,
+        connected by corridors whose length grows with the size.
+    | - Corridors may take a random detour, which is kept away from the other corridors so they never touch.
+    | - Slopes next to each junction point right or down, so part 1 is a longest path in a DAG.
+    """
+    rng = random.Random(seed)
+    spacing = max((isqrt(size) - 3) // (JUNCTIONS - 1), MIN_SPACING)
+    n = (JUNCTIONS - 1) * spacing + 3
+    grid = [["#"] * n for _ in range(n)]
+
+    def carve(cells, slope):
+        for i, (r, c) in enumerate(cells):
+            grid[r][c] = slope if i in (0, len(cells) - 1) else "."
+
+    margin = spacing // 4
+    for i in range(JUNCTIONS):
+        for j in range(JUNCTIONS):
+            r, c = 1 + i * spacing, 1 + j * spacing
+            grid[r][c] = "."
+
+            for horizontal in (True, False):
+                if (j if horizontal else i) == JUNCTIONS - 1:
+                    continue
+
+                # Take a detour of at least 2 tiles, between two legs that are at least 2 tiles apart,
+                # so that the detour does not touch itself or the other corridors.
+                # Corridors on the edge of the lattice only take detours inwards.
+                detour = start = stop = 0
+                if margin > 2:
+                    edge = i if horizontal else j
+                    sign = (
+                        1
+                        if edge == 0
+                        else -1 if edge == JUNCTIONS - 1 else rng.choice((-1, 1))
+                    )
+                    detour = sign * rng.randint(2, margin - 1)
+                    start = rng.randrange(margin + 1, spacing - margin - 2)
+                    stop = rng.randint(start + 2, spacing - margin - 1)
+
+                step = 1 if detour > 0 else -1
+                cells = []
+                for k in range(1, spacing):
+                    if detour and k == start:
+                        cells += [(k, off) for off in range(0, detour + step, step)]
+                    elif detour and k == stop:
+                        cells += [(k, off) for off in range(detour, -step, -step)]
+                    else:
+                        cells.append((k, detour if start < k < stop else 0))
+
+                if horizontal:
+                    carve([(r + off, c + k) for k, off in cells], ">")
+                else:
+                    carve([(r + k, c + off) for k, off in cells], "v")
+
+    grid[0][1] = "."
+    grid[-1][-2] = "."
+    return "\n".join(map("".join, grid)) + "\n"
@@ -1,5 +1,5 @@
 from collections import deque
-from typing import List
+from typing import List, Tuple
 
 from advent_of_code_solver import BaseSolver
 
@@ -11,35 +11,37 @@ DIRECTIONS = {
     ">": Coordinate(1j),
     "v": Coordinate(1),
 }
+SLOPES = set(DIRECTIONS)
 
 
-def create_graph(grid: List[str], ignore_slopes: bool = False) -> Graph:
+def create_graphs(grid: List[str]) -> Tuple[Graph, Graph]:
     """
-    Creates a graph from the input grid. The vertices are all the cells with 3 or more adjacent cells.
+    Creates the graphs of both parts from the input grid. The vertices are all the cells with 3 or more adjacent cells.
+    The edges of both graphs are found by the same BFS from each vertex, which ignores slopes but keeps track of
+    whether the path so far has only gone down slopes.
     :param grid: The input grid
-    :param ignore_slopes: If True, the graph will ignore slopes and consider all adjacent cells as neighbours
-    :return: A Graph object
+    :return: A tuple of (graph that follows slopes, graph that ignores slopes)
     """
 
     def adjacent(coor: Coordinate) -> List[Coordinate]:
         """
-        A helper function that returns a list of adjacent cells as Coordinate objects
+        A helper function that returns a list of adjacent cells as Coordinate objects, ignoring slopes
         """
-        adj = DIRECTIONS.values()
-
-        # If ignore_slopes is False, then we fix its adjacent if the cell is a slope
-        if not ignore_slopes and grid[coor.r][coor.c] in ("^", "<", ">", "v"):
-            adj = [DIRECTIONS[grid[coor.r][coor.c]]]
-
-        # Iterate through all the adjacent cells and check that they are in bounds and not walls
         result = []
-        for d in adj:
+        for d in DIRECTIONS.values():
             nr, nc = coor + d
             if nr in range(m) and nc in range(n) and grid[nr][nc] != "#":
                 result.append(Coordinate(complex(nr, nc)))
 
         return result
 
+    def is_downhill(curr: Coordinate, adj: Coordinate) -> bool:
+        """
+        A helper function that checks whether a step from curr to adj follows the slope of curr, if any
+        """
+        tile = grid[curr.r][curr.c]
+        return tile not in SLOPES or curr + DIRECTIONS[tile] == adj
+
     m, n = len(grid), len(grid[0])
     start, end = Coordinate(complex(1, 1)), Coordinate(complex(m - 2, n - 2))
 
@@ -53,28 +55,46 @@ def create_graph(grid: List[str], ignore_slopes: bool = False) -> Graph:
     # Convert into a set
     vertices = set(vertices_list)
 
-    # Create a graph from the vertices
-    g = {v: {} for v in vertices}
-    # For each vertex, do a BFS to find the distance to its neighbouring vertices
+    # Create both graphs from the vertices
+    sloped = {v: {} for v in vertices}
+    flat = {v: {} for v in vertices}
+    # For each vertex, do a BFS to find the distance to its neighbouring vertices.
+    # Cells are visited separately for paths that have only gone down slopes and for those that have not,
+    # so that the shortest downhill path is found even if a shorter path climbs a slope.
     for v in vertices:
-        q = deque([(v, 0)])
-        visited = {v}
+        q = deque([(v, 0, True)])
+        visited = {(v, True)}
 
         while q:
-            curr, dist = q.popleft()
+            curr, dist, downhill = q.popleft()
 
-            # If the current cell is a vertex and not the original vertex, then we add it to the graph as a neighbour
+            # If the current cell is a vertex and not the original vertex, then we add it to the graphs as a neighbour.
+            # The BFS visits cells in order of distance, so only the first distance to each vertex is kept.
             if curr in vertices and curr != v:
-                g[v][curr] = dist
+                flat[v].setdefault(curr, dist)
+                if downhill:
+                    sloped[v].setdefault(curr, dist)
                 continue
 
             # Otherwise, we continue the BFS
             for adj in adjacent(curr):
-                if adj not in visited:
-                    visited.add(adj)
-                    q.append((adj, dist + 1))
+                adj_downhill = downhill and is_downhill(curr, adj)
+                if (adj, adj_downhill) not in visited:
+                    visited.add((adj, adj_downhill))
+                    q.append((adj, dist + 1, adj_downhill))
+
+    return Graph(sloped), Graph(flat)
+
 
-    return Graph(g)
+def get_hike_length(grid: List[str], graph: Graph) -> int:
+    """
+    Returns the length of the longest hike through the graph, including the entrance and exit
+    that were replaced with walls.
+    """
+    m, n = len(grid), len(grid[0])
+    start, end = Coordinate(complex(1, 1)), Coordinate(complex(m - 2, n - 2))
+
+    return graph.get_longest_path(start, end) + 2
 
 
 class Solver(BaseSolver):
@@ -95,15 +115,16 @@ class Solver(BaseSolver):
 
     def solve_part1(self):
         grid: List[str] = self.input
-        m, n = len(grid), len(grid[0])
-        start, end = Coordinate(complex(1, 1)), Coordinate(complex(m - 2, n - 2))
-
-        return create_graph(grid).get_longest_path(start, end) + 2
+        sloped, _ = create_graphs(grid)
+        return get_hike_length(grid, sloped)
 
     def solve_part2(self):
         # Takes 50 seconds to run, don't run unless you have to
         grid: List[str] = self.input
-        m, n = len(grid), len(grid[0])
-        start, end = Coordinate(complex(1, 1)), Coordinate(complex(m - 2, n - 2))
+        _, flat = create_graphs(grid)
+        return get_hike_length(grid, flat)
 
-        return create_graph(grid, ignore_slopes=True).get_longest_path(start, end) + 2
+    def solve_both(self):
+        grid: List[str] = self.input
+        sloped, flat = create_graphs(grid)
+        return get_hike_length(grid, sloped), get_hike_length(grid, flat)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Dict
 
+import instrumentation
+
 
 @dataclass
 class Coordinate:
@@ -44,6 +46,9 @@ class Graph:
             """
             Performs a DFS from curr to end, keeping track of the number of steps taken
             """
+            nonlocal expanded
+            expanded += 1
+
             # If we have reached the end, then we update the longest path
             if curr == end:
                 nonlocal longest
@@ -63,6 +68,9 @@ class Graph:
                     visited.remove(neighbour)
 
         longest = 0
+        expanded = 0
         visited = set()
         dfs(start)
+
+        instrumentation.count("day23.dfs_nodes", expanded)
         return longest
@@ -0,0 +1,26 @@
+import random
+
+BASE_SIZE = 300
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates the given number of hailstones, which are all hit by a single rock thrown at a random position
+    and velocity. Each hailstone is placed so that it meets the rock at a distinct time.
+    No hailstone has a zero x velocity, since the solver divides by it.
+    """
+    rng = random.Random(seed)
+    rock_p = [rng.randint(200_000_000_000_000, 300_000_000_000_000) for _ in range(3)]
+    rock_v = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(100_000_000_000, 1_000_000_000_000), size)
+
+    lines = []
+    for t in times:
+        v = [rng.randint(-500, 500) for _ in range(3)]
+        while v[0] == 0 or v[0] == rock_v[0]:
+            v[0] = rng.randint(-500, 500)
+
+        p = [rp + t * (rv - hv) for rp, rv, hv in zip(rock_p, rock_v, v)]
+        lines.append(f"{p[0]}, {p[1]}, {p[2]} @ {v[0]}, {v[1]}, {v[2]}")
+
+    return "\n".join(lines) + "\n"
@@ -3,8 +3,6 @@ from collections import namedtuple
 from itertools import combinations
 from typing import List, Optional, Tuple
 
-import z3
-
 from advent_of_code_solver import BaseSolver
 
 # Represents a Hailstone in 3D space
@@ -65,6 +63,9 @@ class Solver(BaseSolver):
         return result
 
     def solve_part2(self):
+        # z3 is slow to import, so it is only imported when part 2 is actually solved
+        import z3
+
         hailstones: List[Hailstone] = self.input
         pxr, pyr, pzr, vxr, vyr, vzr = z3.Reals("pxr pyr pzr vxr vyr vzr")
         solver = z3.Solver()
@@ -0,0 +1,51 @@
+import random
+from collections import defaultdict
+from string import ascii_lowercase
+
+BASE_SIZE = 1500
+
+EDGES_PER_COMPONENT = 3
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Generates a wiring diagram with the given number of components.
+    The components are split into two random, well-connected groups, which are joined by exactly three wires.
+    """
+    rng = random.Random(seed)
+    length = 3
+    while 26**length < size:
+        length += 1
+
+    names = []
+    for num in rng.sample(range(26**length), size):
+        name = ""
+        for _ in range(length):
+            num, idx = divmod(num, 26)
+            name += ascii_lowercase[idx]
+        names.append(name)
+
+    groups = [names[: size // 2], names[size // 2 :]]
+
+    edges = set()
+    for group in groups:
+        for i, name in enumerate(group):
+            # Chain the group first, so that it is connected.
+            if i > 0:
+                edges.add(frozenset((group[i - 1], name)))
+            for other in rng.sample(group, min(EDGES_PER_COMPONENT, len(group))):
+                if other != name:
+                    edges.add(frozenset((name, other)))
+
+    for left, right in zip(rng.sample(groups[0], 3), rng.sample(groups[1], 3)):
+        edges.add(frozenset((left, right)))
+
+    wires = defaultdict(list)
+    for edge in edges:
+        curr, other = rng.sample(sorted(edge), 2)
+        wires[curr].append(other)
+
+    return (
+        "\n".join(f"{curr}: {' '.join(others)}" for curr, others in wires.items())
+        + "\n"
+    )
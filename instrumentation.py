@@ -0,0 +1,60 @@
+"""
+Lightweight counters and timers that solvers can update from their hot paths.
+Instrumentation is disabled by default, in which case count() only checks a flag and timer() only enters an empty
+context manager. Hot loops should tally into a local variable and report it with a single count() call,
+so that instrumentation costs nothing inside the loop itself.
+"""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+enabled = False
+
+counters: Counter = Counter()
+
+# The total time spent in each timer, in seconds.
+timers: Counter = Counter()
+
+
+def enable(value: bool = True) -> None:
+    global enabled
+    enabled = value
+
+
+def reset() -> None:
+    counters.clear()
+    timers.clear()
+
+
+def count(name: str, n: int = 1) -> None:
+    """
+    Adds n to the counter of the given name, if instrumentation is enabled.
+    """
+    if enabled:
+        counters[name] += n
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """
+    Adds the wall-clock time spent in the context to the timer of the given name, if instrumentation is enabled.
+    Entering a context manager is too slow for the innermost loops, so timers are meant for coarser sections.
+    """
+    if not enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timers[name] += time.perf_counter() - start
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """
+    Returns a copy of all the counters and timers.
+    """
+    return {"counters": dict(counters), "timers": dict(timers)}
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type
+
+import advent_of_code_solver
+from advent_of_code_solver import BaseSolver
+
+
+class ParseCache:
+    """
+    An on-disk cache of parsed inputs. Entries are keyed by the hash of the input and the hash of the solver's
+    source code, so they are invalidated automatically when either changes.
+    Once the cache grows past max_bytes, the least recently used entries are evicted.
+    """
+
+    SUFFIX = ".pickle"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Source hashes only change between runs, so they are computed once per solver class.
+        self._source_hashes: Dict[Type, str] = {}
+
+    def key(
+        self, solver_cls: Type[BaseSolver], data: bytes, engine: Optional[str] = None
+    ) -> str:
+        """
+        Returns the cache key of the given input for the given solver class.
+        :param engine: The engine of the solver, since engines may parse the input differently
+        """
+        digest = hashlib.sha256(data)
+        digest.update(self._source_hash(solver_cls).encode())
+        if engine is not None:
+            digest.update(engine.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Looks up the parsed input of the given key, and marks it as recently used.
+        :return: A tuple of (hit, value)
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False, None
+
+        os.utime(path)
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores the parsed input under the given key, then evicts entries if the cache is over its size limit.
+        Values that cannot be pickled are not cached.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        # Write to a temporary file first, so that concurrent readers never see a partial entry.
+        path = self._path(key)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_bytes(data)
+        os.replace(temp, path)
+
+        self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits within its size limit.
+        """
+        entries = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _source_hash(self, solver_cls: Type[BaseSolver]) -> str:
+        """
+        Hashes the source code of the solver's package and of the modules that load it, as well as the Python version,
+        since pickles are not guaranteed to be compatible across versions.
+        """
+        if solver_cls not in self._source_hashes:
+            package = Path(sys.modules[solver_cls.__module__].__file__).parent
+            digest = hashlib.sha256(sys.version.encode())
+
+            sources = [Path(advent_of_code_solver.__file__), Path(__file__)]
+            for path in sorted(package.glob("*.py")) + sources:
+                digest.update(path.read_bytes())
+
+            self._source_hashes[solver_cls] = digest.hexdigest()
+
+        return self._source_hashes[solver_cls]
@@ -0,0 +1,264 @@
+import sys
+import typing
+from types import SimpleNamespace
+from typing import List, Optional
+
+import instrumentation
+
+from . import discovery
+from .timing import PHASES, RunResult, run_day
+
+if typing.TYPE_CHECKING:
+    import argparse
+
+# The defaults of the options, shared by the parser and the plain list of days.
+DEFAULTS = {
+    "parts": [1, 2],
+    "input": discovery.DEFAULT_INPUT,
+    "repeat": 1,
+    "warmup": 0,
+    "cache": None,
+    "cache_size": 256,
+    "stream": False,
+    "engine": None,
+    "profile": False,
+    "memory": False,
+    "profile_dir": discovery.DEFAULT_PROFILES,
+    "counters": False,
+    "record": None,
+    "json": False,
+}
+
+
+def format_table(results: List[RunResult]) -> str:
+    """
+    Formats the median wall-clock and CPU time of each phase as a table, in milliseconds.
+    """
+    header = f"{'day':>3}  " + "  ".join(
+        f"{phase + ' wall/cpu':>19}" for phase in PHASES
+    )
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        summary = result.summary()
+        cells = []
+        for phase in PHASES:
+            if phase in summary:
+                wall = summary[phase]["wall"]["median"] * 1000
+                cpu = summary[phase]["cpu"]["median"] * 1000
+                cells.append(f"{wall:>9.2f}/{cpu:>9.2f}")
+            else:
+                cells.append(f"{'-':^19}")
+        lines.append(f"{result.day:>3}  " + "  ".join(cells))
+
+    return "\n".join(lines)
+
+
+def format_details(result: RunResult) -> List[str]:
+    """
+    Formats the counters, timers and peak memory of a result, if any.
+    """
+    lines = []
+    for name, value in result.instrumentation.get("counters", {}).items():
+        lines.append(f"{name}: {value}")
+    for name, seconds in result.instrumentation.get("timers", {}).items():
+        lines.append(f"{name}: {seconds * 1000:.2f} ms")
+    for phase, peak in result.peak_memory.items():
+        lines.append(f"{phase} peak memory: {peak / 1024:.1f} KiB")
+    return lines
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    # argparse is slow to import, so it is only imported when there are options to parse.
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m runner",
+        description="Runs and benchmarks the Advent of Code solvers.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=discovery.parse_days,
+        help="Days to run, e.g. 7 or 1-5. Runs all discovered days by default.",
+    )
+    parser.add_argument(
+        "-p",
+        "--parts",
+        nargs="+",
+        type=int,
+        choices=(1, 2),
+        default=DEFAULTS["parts"],
+        help="Parts to solve (default: both).",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        default=DEFAULTS["input"],
+        help="Input file pattern, formatted with the day number (default: dayNN/input.txt).",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=DEFAULTS["repeat"],
+        help="Number of timed iterations per day (default: 1).",
+    )
+    parser.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=DEFAULTS["warmup"],
+        help="Number of untimed iterations to run first (default: 0).",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=discovery.DEFAULT_CACHE,
+        help="Cache parsed inputs in this directory (default: .parse_cache).",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULTS["cache_size"],
+        help="Maximum size of the parse cache, in MiB (default: 256).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Solve both parts in a single pass over the input lines, for days that support it.",
+    )
+    parser.add_argument(
+        "--engine",
+        help="Run days that have this engine (e.g. numpy) with it, and the others with their default engine.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each phase with cProfile, and write its stats to the profile directory.",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Trace the memory allocations of each phase with tracemalloc, "
+        "and write its peak and largest allocations to the profile directory.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=DEFAULTS["profile_dir"],
+        help="Directory of the profiling reports (default: .profiles).",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="Enable the counters and timers of the solvers, and print them.",
+    )
+    parser.add_argument(
+        "--record",
+        nargs="?",
+        const=discovery.DEFAULT_BENCHMARKS,
+        help="Append the timings to this benchmark database (default: .benchmarks.sqlite).",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    return parser
+
+
+def parse_plain_days(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parses a plain list of days without argparse, since it is the most common invocation, e.g. "python -m runner 7".
+    :return: The same arguments as the parser, or None if there are options or invalid days
+    """
+    days = []
+    for arg in argv:
+        start, sep, stop = arg.partition("-")
+        if not start.isdecimal() or not (stop.isdecimal() or not sep):
+            return None
+        days.append(discovery.parse_days(arg))
+
+    return SimpleNamespace(days=days, **DEFAULTS)
+
+
+def main(argv: List[str] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    args = parse_plain_days(argv)
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args(argv)
+    available = discovery.discover_days()
+    if args.engine is not None:
+        # A misspelled engine would otherwise run every day with its default engine.
+        engines = discovery.discover_engines(available)
+        if args.engine not in engines:
+            parser.error(
+                f"unknown engine {args.engine!r}, expected one of: {', '.join(sorted(engines))}"
+            )
+    cache = None
+    if args.cache:
+        # The parse cache is only imported when it is used, to keep startup fast.
+        from parse_cache import ParseCache
+
+        cache = ParseCache(args.cache, args.cache_size * 1024 * 1024)
+
+    profiler = None
+    if args.profile or args.memory:
+        from .profiling import Profiler
+
+        profiler = Profiler(args.profile_dir, args.profile, args.memory)
+
+    instrumentation.enable(args.counters)
+
+    history = None
+    if args.record:
+        from . import history as benchmarks
+
+        history = benchmarks.BenchmarkHistory(args.record)
+        git_rev, machine = benchmarks.git_revision(), benchmarks.machine_fingerprint()
+
+    days = sorted({day for days in args.days for day in days}) or available
+    results = []
+
+    for day in days:
+        if day not in available:
+            print(f"day {day:02d}: no solver found, skipping", file=sys.stderr)
+            continue
+
+        input_file = discovery.input_path(day, args.input)
+        if not input_file.is_file():
+            print(f"day {day:02d}: {input_file} not found, skipping", file=sys.stderr)
+            continue
+
+        result = run_day(
+            day,
+            input_file,
+            args.parts,
+            args.repeat,
+            args.warmup,
+            cache,
+            args.stream,
+            profiler,
+            args.engine,
+        )
+        results.append(result)
+        if history is not None:
+            history.record(result, git_rev, machine, profiler is not None)
+
+        if not args.json:
+            answers = ", ".join(f"{k}={v}" for k, v in result.answers.items())
+            print(f"day {day:02d}: {answers}")
+            for line in format_details(result):
+                print(f"  {line}")
+
+    if args.json:
+        import json
+
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+    else:
+        print(format_table(results))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
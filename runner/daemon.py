@@ -0,0 +1,319 @@
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+from concurrent import futures
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from . import discovery
+from .timing import PARSE, measure, solve_parsed
+
+# The parse cache of each worker process, which is created by init_worker.
+_cache = None
+
+
+def init_worker(
+    days: Iterable[int], cache_dir: Optional[str], cache_size: int, processes: int
+):
+    """
+    Imports the solvers of the given days once in each worker process, so that requests never pay for the imports.
+    The number of processes of each solver is lowered to the worker's share of the CPUs, as in the scheduler,
+    so that solvers with their own pool (e.g. day16) do not oversubscribe the machine.
+    """
+    global _cache
+    if cache_dir:
+        from parse_cache import ParseCache
+
+        _cache = ParseCache(cache_dir, cache_size)
+
+    for day in days:
+        try:
+            solver_cls = discovery.load_solver(day)
+        except ImportError:
+            # Days with missing dependencies fail when they are requested instead.
+            continue
+        solver_cls.PROCESSES = min(solver_cls.PROCESSES, processes)
+
+
+def solve(day: int, data: bytes, parts: List[int]) -> Dict[str, Any]:
+    """
+    Solves a request in a worker process.
+    :return: The answers and the wall-clock and CPU time of each phase, in seconds
+    """
+    solver = discovery.load_solver(day)(None)
+    _, parse_timing = measure(solver.load_input, data, _cache)
+    answers, timings = solve_parsed(solver, parts)
+    timings = {PARSE: parse_timing, **timings}
+
+    return {
+        "day": day,
+        "answers": {phase: str(answer) for phase, answer in answers.items()},
+        "timings": {phase: timing._asdict() for phase, timing in timings.items()},
+    }
+
+
+class RequestError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class SolverPool:
+    """
+    A bounded pool of warm worker processes. Requests wait in a queue of bounded size for a free worker,
+    and are rejected once the queue is full, before their body is read, and the bodies are bounded in size,
+    so that a burst of requests cannot exhaust the memory of the daemon.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        cache_dir: Optional[str] = None,
+        cache_size: int = 256 * 1024 * 1024,
+        max_body: int = 64 * 1024 * 1024,
+    ):
+        self.days = discovery.discover_days()
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_body = max_body
+        self.executor = futures.ProcessPoolExecutor(
+            workers,
+            initializer=init_worker,
+            initargs=(
+                self.days,
+                cache_dir,
+                cache_size,
+                max(1, (os.cpu_count() or 1) // workers),
+            ),
+        )
+
+        # The number of requests that are running or waiting for a worker.
+        self.pending = 0
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def admit(self, day: int) -> Iterator[None]:
+        """
+        Reserves a pending slot for a request while it is read and solved, or rejects it if the queue is full.
+        """
+        if day not in self.days:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"no solver found for day {day}")
+
+        with self.lock:
+            if self.pending >= self.workers + self.queue_size:
+                raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "queue is full")
+            self.pending += 1
+
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.pending -= 1
+
+    def solve(self, day: int, data: bytes, parts: List[int]) -> Dict[str, Any]:
+        """
+        Solves an admitted request on the pool, blocking until it is done.
+        """
+        try:
+            return self.executor.submit(solve, day, data, parts).result()
+        except Exception as e:
+            raise RequestError(
+                HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(e).__name__}: {e}"
+            )
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "days": self.days,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "max_body": self.max_body,
+            "pending": self.pending,
+        }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the solver pool of the server over HTTP:
+
+    | GET /status: the days that can be solved, and the number of pending requests
+    | POST /solve?day=7&parts=1,2: solves the input in the request body
+    """
+
+    def do_GET(self):
+        if urlsplit(self.path).path != "/status":
+            return self.send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        self.send_json(HTTPStatus.OK, self.server.pool.status())
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/solve":
+            return self.send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+        try:
+            query = parse_qs(url.query)
+            day, parts = parse_query(query)
+            pool = self.server.pool
+            length = parse_content_length(self.headers, pool.max_body)
+            # The body is only read once the request is admitted, so that rejected requests hold no input.
+            with pool.admit(day):
+                data = self.rfile.read(length)
+                result = pool.solve(day, data, parts)
+        except RequestError as e:
+            return self.send_json(e.status, {"error": str(e)})
+
+        self.send_json(HTTPStatus.OK, result)
+
+    def send_json(self, status: HTTPStatus, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Every response already carries its own timings, so requests are not logged.
+        pass
+
+
+def parse_query(query: Dict[str, List[str]]) -> Tuple[int, List[int]]:
+    """
+    Parses the day and the parts of a solve request.
+    :return: A tuple of (day, parts)
+    """
+    try:
+        day = int(query["day"][0])
+        parts = [int(part) for part in query.get("parts", ["1,2"])[0].split(",")]
+    except (KeyError, ValueError):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "expected ?day=<day>&parts=<parts>")
+
+    if not parts or not set(parts) <= {1, 2}:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "parts must be 1, 2 or 1,2")
+    return day, parts
+
+
+def parse_content_length(headers, max_length: int) -> int:
+    """
+    Parses the length of the body of a solve request, which must be given, since the input is read from the body.
+    Bodies longer than the maximum length are rejected without reading them.
+    """
+    try:
+        length = int(headers["Content-Length"])
+    except (TypeError, ValueError):
+        length = -1
+
+    if length < 0:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "expected a valid Content-Length")
+    if length > max_length:
+        raise RequestError(
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            f"the body must be at most {max_length} bytes",
+        )
+    return length
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        # Unix sockets have no client address, which the request handler expects.
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.daemon",
+        description="Serves solve requests from warm worker processes over localhost HTTP or a Unix socket.",
+    )
+    address = parser.add_mutually_exclusive_group()
+    address.add_argument(
+        "--port", type=int, default=8023, help="Localhost port (default: 8023)."
+    )
+    address.add_argument("--socket", help="Serve on this Unix socket instead.")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes (default: the number of CPUs).",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=64,
+        help="Number of requests that may wait for a worker before new ones are rejected (default: 64).",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=discovery.DEFAULT_CACHE,
+        help="Cache parsed inputs in this directory (default: .parse_cache).",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help="Maximum size of the parse cache, in MiB (default: 256).",
+    )
+    parser.add_argument(
+        "--max-body",
+        type=int,
+        default=64,
+        help="Maximum size of the input of a request, in MiB (default: 64).",
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    pool = SolverPool(
+        args.workers,
+        args.queue_size,
+        args.cache,
+        args.cache_size * 1024 * 1024,
+        args.max_body * 1024 * 1024,
+    )
+
+    if args.socket:
+        # Remove the socket of a previous daemon that did not shut down cleanly.
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        server = UnixHTTPServer(args.socket, RequestHandler)
+        address = args.socket
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", args.port), RequestHandler)
+        address = f"http://127.0.0.1:{args.port}"
+
+    server.pool = pool
+    print(f"serving {len(pool.days)} days on {address}", file=sys.stderr)
+
+    # Shut down cleanly when stopped by a service manager, as well as on Ctrl-C.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown()
+        if args.socket:
+            os.unlink(args.socket)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
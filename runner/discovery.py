@@ -0,0 +1,101 @@
+import glob
+import importlib
+import re
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, List, Set, Type
+
+from advent_of_code_solver import BaseSolver
+
+# The repository root, which contains all the dayNN packages.
+ROOT = Path(__file__).resolve().parent.parent
+
+DAY_PACKAGE = re.compile(r"day(\d{2})")
+
+# The default location of the input file for each day.
+DEFAULT_INPUT = str(ROOT / "day{day:02d}" / "input.txt")
+
+# The default directory of the parse cache.
+DEFAULT_CACHE = str(ROOT / ".parse_cache")
+
+# The default directory of the profiling reports.
+DEFAULT_PROFILES = str(ROOT / ".profiles")
+
+# The default database of recorded benchmarks.
+DEFAULT_BENCHMARKS = str(ROOT / ".benchmarks.sqlite")
+
+# The default file of previous timings, used by the scheduler.
+DEFAULT_HISTORY = str(ROOT / ".timing_history.json")
+
+
+def discover_days() -> List[int]:
+    """
+    Finds all the dayNN packages in the repository root that contain a solver module.
+    :return: A sorted list of day numbers.
+    """
+    days = []
+    for path in ROOT.iterdir():
+        match = DAY_PACKAGE.fullmatch(path.name)
+        if match and (path / "solver.py").is_file():
+            days.append(int(match.group(1)))
+
+    return sorted(days)
+
+
+def parse_days(value: str) -> List[int]:
+    """
+    Parses a day argument, which is either a single day (e.g. "7") or an inclusive range (e.g. "1-5").
+    """
+    start, _, stop = value.partition("-")
+    try:
+        return list(range(int(start), int(stop or start) + 1))
+    except ValueError:
+        # argparse is only imported on error, since a plain list of days is parsed without it.
+        import argparse
+
+        raise argparse.ArgumentTypeError(f"invalid day or day range: {value!r}")
+
+
+def load_solver(day: int) -> Type[BaseSolver]:
+    """
+    Imports the solver module of the given day and returns its Solver class.
+    """
+    module = importlib.import_module(f"day{day:02d}.solver")
+    return module.Solver
+
+
+def discover_engines(days: Iterable[int]) -> Set[str]:
+    """
+    Finds the engines that any of the solvers of the given days can be run with.
+    Days whose solvers cannot be imported, e.g. because of missing dependencies, are left out.
+    """
+    engines = set()
+    for day in days:
+        try:
+            engines.update(load_solver(day).ENGINES)
+        except ImportError:
+            pass
+    return engines
+
+
+def load_generator(day: int) -> ModuleType:
+    """
+    Imports the input generator module of the given day.
+    """
+    return importlib.import_module(f"day{day:02d}.generator")
+
+
+def input_path(day: int, pattern: str = DEFAULT_INPUT) -> Path:
+    """
+    Resolves the input file of the given day. The pattern is formatted with the day number,
+    e.g. "inputs/day{day:02d}.txt".
+    """
+    return Path(pattern.format(day=day))
+
+
+def input_paths(day: int, pattern: str = DEFAULT_INPUT) -> List[Path]:
+    """
+    Resolves all the input files of the given day. The pattern is formatted with the day number,
+    and may contain glob wildcards, e.g. "inputs/day{day:02d}/*.txt".
+    """
+    return [Path(path) for path in sorted(glob.glob(pattern.format(day=day)))]
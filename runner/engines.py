@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import Iterable, List
+
+from . import discovery
+from .timing import PARSE, READ, RunResult, run_day
+
+# Generated inputs are this many times the BASE_SIZE of the generator by default, so that the fixed costs of the
+# engines do not dominate.
+DEFAULT_SCALE = 100
+
+
+def parse_time(result: RunResult) -> float:
+    """
+    Returns the median wall-clock time of the parse phase, in seconds.
+    """
+    return result.summary().get(PARSE, {}).get("wall", {}).get("median", 0)
+
+
+def solve_time(result: RunResult) -> float:
+    """
+    Returns the total median wall-clock time of the phases after parsing, in seconds.
+    """
+    return sum(
+        clocks["wall"]["median"]
+        for phase, clocks in result.summary().items()
+        if phase not in (READ, PARSE)
+    )
+
+
+def run_engines(
+    day: int,
+    input_file: str,
+    parts: Iterable[int] = (1, 2),
+    repeat: int = 5,
+    warmup: int = 1,
+) -> List[RunResult]:
+    """
+    Runs the solver of the given day with each of its engines on the same input.
+    The warmup iterations also keep the lazy imports of an engine (e.g. NumPy) out of its timings.
+    """
+    return [
+        run_day(day, input_file, parts, repeat, warmup, engine=engine)
+        for engine in discovery.load_solver(day).ENGINES
+    ]
+
+
+def mismatches(results: List[RunResult]) -> List[str]:
+    """
+    Lists the answers of each engine that differ from those of the default engine.
+    """
+    default = results[0]
+    return [
+        f"day {result.day:02d} {part}: {result.engine}={answer} "
+        f"but {default.engine}={default.answers.get(part)}"
+        for result in results[1:]
+        for part, answer in result.answers.items()
+        if answer != default.answers.get(part)
+    ]
+
+
+def format_table(results: List[List[RunResult]]) -> str:
+    """
+    Formats the median parse and solve time of each engine as a table, in milliseconds,
+    with the speedup of their total over the default engine. Both are included, since some engines do most of
+    their work while parsing.
+    """
+    header = f"{'day':>3}  {'engine':<8}  {'parse':>10}  {'solve':>10}  {'speedup':>7}"
+    lines = [header, "-" * len(header)]
+
+    for day_results in results:
+        default = parse_time(day_results[0]) + solve_time(day_results[0])
+        for result in day_results:
+            parse, solve = parse_time(result), solve_time(result)
+            total = parse + solve
+            speedup = f"{default / total:>6.1f}x" if total else f"{'-':>7}"
+            lines.append(
+                f"{result.day:>3}  {result.engine:<8}  {parse * 1000:>10.2f}  "
+                f"{solve * 1000:>10.2f}  {speedup}"
+            )
+
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.engines",
+        description="Benchmarks the engines of the solvers against each other, and checks that their answers match.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=discovery.parse_days,
+        help="Days to run, e.g. 7 or 1-5. Runs all days that have several engines by default.",
+    )
+    parser.add_argument(
+        "-p", "--parts", nargs="+", type=int, choices=(1, 2), default=[1, 2]
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        help="Input file pattern, formatted with the day number. Inputs are generated by default.",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        help="The size of the generated inputs (default: 100 times the BASE_SIZE of each generator).",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-w", "--warmup", type=int, default=1)
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    days = sorted({day for days in args.days for day in days}) or [
+        day
+        for day in discovery.discover_days()
+        if len(discovery.load_solver(day).ENGINES) > 1
+    ]
+
+    results, errors = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        for day in days:
+            if args.input:
+                input_file = str(discovery.input_path(day, args.input))
+            else:
+                generator = discovery.load_generator(day)
+                input_file = os.path.join(tmp, f"day{day:02d}.txt")
+                with open(input_file, "w") as file:
+                    size = args.size or generator.BASE_SIZE * DEFAULT_SCALE
+                    file.write(generator.generate(size, args.seed))
+
+            day_results = run_engines(
+                day, input_file, args.parts, args.repeat, args.warmup
+            )
+            results.append(day_results)
+            errors += mismatches(day_results)
+
+    if args.json:
+        print(
+            json.dumps(
+                [result.to_dict() for day in results for result in day], indent=2
+            )
+        )
+    else:
+        print(format_table(results))
+
+    for error in errors:
+        print(error, file=sys.stderr)
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,413 @@
+import argparse
+import hashlib
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from math import comb
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+from . import discovery
+from .timing import PHASES, RunResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    timestamp REAL NOT NULL,
+    day INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    git_rev TEXT NOT NULL,
+    machine TEXT NOT NULL,
+    wall REAL NOT NULL,
+    cpu REAL NOT NULL,
+    profiled INTEGER NOT NULL,
+    peak_memory INTEGER,
+    engine TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_rev ON samples (machine, git_rev);
+"""
+
+# A benchmark is keyed by (day, engine, phase, input hash) within a git revision and machine.
+BenchmarkKey = Tuple[int, str, str, str]
+
+
+def git_revision() -> str:
+    """
+    Returns the short hash of the checked out commit, with a "-dirty" suffix if tracked files have been modified.
+    """
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=discovery.ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=discovery.ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{rev}-dirty" if status.strip() else rev
+
+
+def machine_fingerprint() -> str:
+    """
+    Identifies the machine and Python build, since timings are only comparable on the same ones.
+    """
+    parts = [
+        platform.node(),
+        platform.machine(),
+        platform.processor(),
+        platform.python_implementation(),
+        platform.python_version(),
+        str(os.cpu_count()),
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:12]
+
+
+def input_hash(input_file: str) -> str:
+    with open(input_file, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()[:16]
+
+
+def median_interval(
+    values: List[float], confidence: float = 0.95
+) -> Tuple[float, float]:
+    """
+    Returns a distribution-free confidence interval of the median, from the order statistics of the values.
+    The number of values below the median follows a Binomial(n, 1/2) distribution, so the interval is bounded by
+    the k-th smallest and k-th largest values, for the largest k that keeps each tail within (1 - confidence) / 2.
+    With too few values to reach the confidence level, the interval is the full range of the values.
+    """
+    values = sorted(values)
+    n = len(values)
+    tail = (1 - confidence) / 2
+
+    k, cumulative = 0, comb(n, 0) / 2**n
+    while k < n // 2 and cumulative <= tail:
+        k += 1
+        cumulative += comb(n, k) / 2**n
+
+    if k == 0:
+        return values[0], values[-1]
+    return values[k - 1], values[n - k]
+
+
+class BenchmarkHistory:
+    """
+    An SQLite database of every timed phase of every recorded run.
+    Each repeat of a phase is stored as a separate sample, so that later runs can be compared statistically.
+    """
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def record(
+        self, result: RunResult, git_rev: str, machine: str, profiled: bool = False
+    ) -> None:
+        """
+        Appends every repeat of every phase of the result.
+        :param profiled: Whether the run was profiled, in which case its timings are only kept for reference,
+            and are not compared with those of unprofiled runs
+        """
+        digest = input_hash(result.input_file)
+        now = time.time()
+
+        rows = [
+            (
+                now,
+                result.day,
+                phase,
+                digest,
+                git_rev,
+                machine,
+                timing.wall,
+                timing.cpu,
+                profiled,
+                result.peak_memory.get(phase),
+                result.engine,
+            )
+            for phase, timings in result.timings.items()
+            for timing in timings
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def revisions(self, machine: str) -> List[str]:
+        """
+        Returns the git revisions that have been recorded on the machine, in the order that they were last recorded.
+        """
+        rows = self.connection.execute(
+            "SELECT git_rev FROM samples WHERE machine = ? "
+            "GROUP BY git_rev ORDER BY MAX(timestamp)",
+            (machine,),
+        )
+        return [rev for rev, in rows]
+
+    def samples(
+        self, git_rev: str, machine: str
+    ) -> Dict[BenchmarkKey, Tuple[List[float], List[int]]]:
+        """
+        Returns the samples of each benchmark of a git revision on the machine.
+        :return: A mapping of (day, engine, phase, input hash) -> (wall-clock times of the unprofiled runs,
+            peak memory of the memory-profiled runs)
+        """
+        rows = self.connection.execute(
+            "SELECT day, engine, phase, input_hash, wall, profiled, peak_memory "
+            "FROM samples WHERE git_rev = ? AND machine = ?",
+            (git_rev, machine),
+        )
+
+        result = defaultdict(lambda: ([], []))
+        for day, engine, phase, digest, wall, profiled, peak in rows:
+            walls, peaks = result[(day, engine, phase, digest)]
+            if not profiled:
+                walls.append(wall)
+            if peak is not None:
+                peaks.append(peak)
+
+        return dict(result)
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def compare(
+    base: Dict[BenchmarkKey, Tuple[List[float], List[int]]],
+    new: Dict[BenchmarkKey, Tuple[List[float], List[int]]],
+    threshold: float = 0.05,
+    confidence: float = 0.95,
+) -> List[Dict]:
+    """
+    Compares the benchmarks that both revisions have samples of.
+    A benchmark is slower if the confidence intervals of the medians do not overlap, and the median is more than
+    threshold slower. Memory grows if the median peak memory is more than threshold larger,
+    since peak memory barely varies between runs.
+    """
+    rows = []
+    for key in sorted(base.keys() & new.keys()):
+        (base_walls, base_peaks), (new_walls, new_peaks) = base[key], new[key]
+        day, engine, phase, digest = key
+        row = {
+            "day": day,
+            "engine": engine,
+            "phase": phase,
+            "input_hash": digest,
+            "base": None,
+            "new": None,
+            "change": None,
+            "memory_change": None,
+            "flags": [],
+        }
+
+        if base_walls and new_walls:
+            base_low, base_high = median_interval(base_walls, confidence)
+            new_low, new_high = median_interval(new_walls, confidence)
+            row["base"] = (median(base_walls), base_low, base_high)
+            row["new"] = (median(new_walls), new_low, new_high)
+            row["change"] = change = median(new_walls) / median(base_walls) - 1
+
+            if new_low > base_high and change > threshold:
+                row["flags"].append("slower")
+            elif new_high < base_low and change < -threshold:
+                row["flags"].append("faster")
+
+        if base_peaks and new_peaks:
+            row["memory_change"] = median(new_peaks) / median(base_peaks) - 1
+            if row["memory_change"] > threshold:
+                row["flags"].append("more memory")
+
+        rows.append(row)
+
+    return rows
+
+
+def format_comparison(rows: List[Dict]) -> str:
+    """
+    Formats the comparison as a table of the medians and their confidence intervals, in milliseconds.
+    """
+    header = (
+        f"{'day':>3}  {'engine':<6}  {'phase':<6}  {'input':<8}"
+        f"  {'base (ms)':>26}  {'new (ms)':>26}  {'change':>7}  {'memory':>7}  flags"
+    )
+    lines = [header, "-" * len(header)]
+
+    def interval(stats: Optional[Tuple[float, float, float]]) -> str:
+        if stats is None:
+            return "-"
+        mid, low, high = (value * 1000 for value in stats)
+        return f"{mid:.2f} [{low:.2f}, {high:.2f}]"
+
+    def percentage(change: Optional[float]) -> str:
+        return f"{change:>+7.1%}" if change is not None else f"{'-':>7}"
+
+    for row in rows:
+        lines.append(
+            f"{row['day']:>3}  {row['engine']:<6}  {row['phase']:<6}  "
+            f"{row['input_hash'][:8]:<8}  "
+            f"{interval(row['base']):>26}  {interval(row['new']):>26}  "
+            f"{percentage(row['change'])}  {percentage(row['memory_change'])}  "
+            f"{', '.join(row['flags'])}"
+        )
+
+    return "\n".join(lines)
+
+
+def format_trend(
+    history: BenchmarkHistory, machine: str, days: List[int], last: int
+) -> str:
+    """
+    Formats the median wall-clock time of each phase of each day over the last recorded revisions, in milliseconds.
+    Inputs are pooled within each revision, so the trend is only meaningful when the same inputs are recorded.
+    """
+    revisions = history.revisions(machine)[-last:]
+    medians: Dict[Tuple[int, str, str], Dict[str, float]] = defaultdict(dict)
+
+    for rev in revisions:
+        pooled = defaultdict(list)
+        for (day, engine, phase, _), (walls, _) in history.samples(
+            rev, machine
+        ).items():
+            pooled[(day, engine, phase)] += walls
+        for key, walls in pooled.items():
+            if walls:
+                medians[key][rev] = median(walls)
+
+    header = f"{'day':>3}  {'engine':<6}  {'phase':<6}  " + "  ".join(
+        f"{rev[:14]:>14}" for rev in revisions
+    )
+    lines = [header, "-" * len(header)]
+
+    order = {phase: i for i, phase in enumerate(PHASES)}
+    for key in sorted(medians, key=lambda key: (key[0], key[1], order[key[2]])):
+        day, engine, phase = key
+        if days and day not in days:
+            continue
+        cells = [
+            (
+                f"{medians[key][rev] * 1000:>14.2f}"
+                if rev in medians[key]
+                else f"{'-':>14}"
+            )
+            for rev in revisions
+        ]
+        lines.append(f"{day:>3}  {engine:<6}  {phase:<6}  " + "  ".join(cells))
+
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.history",
+        description="Compares the benchmarks recorded with python -m runner --record.",
+    )
+    parser.add_argument(
+        "--db",
+        default=discovery.DEFAULT_BENCHMARKS,
+        help="The benchmark database (default: .benchmarks.sqlite).",
+    )
+    parser.add_argument(
+        "--machine",
+        default=machine_fingerprint(),
+        help="Only use the benchmarks of this machine (default: this machine).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare_parser = commands.add_parser(
+        "compare",
+        help="Flags significant slowdowns and memory growth of a revision against a baseline.",
+    )
+    compare_parser.add_argument("base", help="The git revision of the baseline.")
+    compare_parser.add_argument(
+        "new",
+        nargs="?",
+        help="The git revision to compare (default: the last recorded revision).",
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="The smallest relative change that is flagged (default: 0.05).",
+    )
+    compare_parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="The confidence level of the intervals of the medians (default: 0.95).",
+    )
+
+    trend_parser = commands.add_parser(
+        "trend", help="Shows the median time of each day over the recorded revisions."
+    )
+    trend_parser.add_argument(
+        "days",
+        nargs="*",
+        type=discovery.parse_days,
+        help="Days to show, e.g. 7 or 1-5. Shows all recorded days by default.",
+    )
+    trend_parser.add_argument(
+        "--last",
+        type=int,
+        default=8,
+        help="Number of revisions to show (default: 8).",
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    history = BenchmarkHistory(args.db)
+
+    try:
+        if args.command == "trend":
+            days = sorted({day for days in args.days for day in days})
+            print(format_trend(history, args.machine, days, args.last))
+            return 0
+
+        new: Optional[str] = args.new
+        if new is None:
+            revisions = history.revisions(args.machine)
+            if not revisions:
+                print("no benchmarks recorded on this machine", file=sys.stderr)
+                return 1
+            new = revisions[-1]
+
+        rows = compare(
+            history.samples(args.base, args.machine),
+            history.samples(new, args.machine),
+            args.threshold,
+            args.confidence,
+        )
+    finally:
+        history.close()
+
+    if not rows:
+        print(f"no common benchmarks between {args.base} and {new}", file=sys.stderr)
+        return 1
+
+    print(f"{args.base} -> {new}")
+    print(format_comparison(rows))
+    return (
+        1
+        if any(
+            "slower" in row["flags"] or "more memory" in row["flags"] for row in rows
+        )
+        else 0
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
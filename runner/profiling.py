@@ -0,0 +1,71 @@
+import cProfile
+import functools
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict
+
+# The number of allocation sites listed in each memory report.
+TOP_ALLOCATIONS = 20
+
+
+class Profiler:
+    """
+    Profiles phases of solver runs with cProfile, tracemalloc, or both, and writes a report of each phase:
+
+    | <name>.pstats: the cProfile stats, which can be loaded with pstats or a viewer such as snakeviz
+    | <name>.memory.txt: the peak traced memory, and the lines that hold the most memory at the end of the phase
+
+    Profiling slows the phases down, so their timings should not be compared with unprofiled runs.
+    Only the current process is profiled, so work done in a solver's own pool (e.g. day16) is not included.
+    """
+
+    def __init__(self, directory: str, cpu: bool = True, memory: bool = False):
+        self.directory = Path(directory)
+        self.cpu = cpu
+        self.memory = memory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # The peak traced memory of each phase, in bytes.
+        self.peaks: Dict[str, int] = {}
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """
+        Wraps the function so that each call is profiled, and reported under the given name.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            profile = cProfile.Profile() if self.cpu else None
+            if self.memory:
+                tracemalloc.start()
+            if profile:
+                profile.enable()
+
+            try:
+                return func(*args)
+            finally:
+                if profile:
+                    profile.disable()
+                    profile.dump_stats(self.directory / f"{name}.pstats")
+                if self.memory:
+                    self._write_memory_report(name)
+                    tracemalloc.stop()
+
+        return wrapper
+
+    def _write_memory_report(self, name: str) -> None:
+        _, peak = tracemalloc.get_traced_memory()
+        self.peaks[name] = peak
+
+        # Leave out the allocations of the profilers themselves.
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, cProfile.__file__),
+            ]
+        )
+        lines = [f"peak: {peak / 1024:.1f} KiB", ""]
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            lines.append(str(stat))
+
+        (self.directory / f"{name}.memory.txt").write_text("\n".join(lines) + "\n")
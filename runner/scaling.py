@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from math import log
+from typing import Dict, Iterable, List, Optional
+
+from .discovery import discover_days, load_generator, parse_days
+from .timing import BOTH, PARSE, PART1, PART2, run_day
+
+# Phases that are fitted. Reading the file is left out, since it is linear for every day.
+FITTED_PHASES = (PARSE, PART1, PART2, BOTH)
+
+# Phases that never take longer than this (in seconds) are too noisy to fit.
+MIN_FIT_TIME = 1e-3
+
+
+def fit_exponent(sizes: List[int], times: List[float]) -> Optional[float]:
+    """
+    Fits time = c * size^k with least squares on a log-log scale.
+    :return: The empirical complexity exponent k, or None if there is not enough data to fit.
+    """
+    if len(sizes) < 2 or max(times) < MIN_FIT_TIME:
+        return None
+
+    xs = [log(size) for size in sizes]
+    ys = [log(max(time, 1e-9)) for time in times]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+
+    numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    denominator = sum((x - x_mean) ** 2 for x in xs)
+    return numerator / denominator
+
+
+@dataclass
+class ScalingResult:
+    """
+    The median wall-clock time of each phase of a single day, over doubling input sizes.
+    """
+
+    day: int
+    sizes: List[int] = field(default_factory=list)
+    timings: Dict[str, List[float]] = field(default_factory=dict)
+
+    # The reason the sizes stopped doubling early, if any.
+    error: Optional[str] = None
+
+    def exponents(self) -> Dict[str, Optional[float]]:
+        return {
+            phase: fit_exponent(self.sizes, self.timings[phase])
+            for phase in FITTED_PHASES
+            if phase in self.timings
+        }
+
+    def to_dict(self):
+        return {
+            "day": self.day,
+            "sizes": self.sizes,
+            "timings": self.timings,
+            "exponents": self.exponents(),
+            "error": self.error,
+        }
+
+
+def run_scaling(
+    day: int,
+    start: Optional[int] = None,
+    steps: int = 5,
+    seed: int = 0,
+    parts: Iterable[int] = (1, 2),
+    repeat: int = 1,
+    time_limit: float = 10.0,
+) -> ScalingResult:
+    """
+    Runs the solver of the given day on generated inputs, doubling the input size at each step.
+    Stops early if an input takes longer than the time limit, or if the generator or solver fails at some size.
+    :param start: The first input size, which defaults to the generator's BASE_SIZE
+    """
+    generator = load_generator(day)
+    size = start or generator.BASE_SIZE
+    result = ScalingResult(day)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_file = os.path.join(tmp, "input.txt")
+
+        for _ in range(steps):
+            try:
+                with open(input_file, "w") as file:
+                    file.write(generator.generate(size, seed))
+                summary = run_day(day, input_file, parts, repeat).summary()
+            except Exception as e:
+                result.error = f"size {size}: {type(e).__name__}: {e}"
+                break
+
+            result.sizes.append(size)
+            for phase in FITTED_PHASES:
+                if phase in summary:
+                    median = summary[phase]["wall"]["median"]
+                    result.timings.setdefault(phase, []).append(median)
+
+            if sum(result.timings[phase][-1] for phase in result.timings) > time_limit:
+                break
+            size *= 2
+
+    return result
+
+
+def format_table(results: List[ScalingResult]) -> str:
+    """
+    Formats the fitted exponent of each phase as a table.
+    """
+    header = f"{'day':>3}  {'sizes':>17}  " + "  ".join(
+        f"{phase:>6}" for phase in FITTED_PHASES
+    )
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        exponents = result.exponents()
+        sizes = f"{result.sizes[0]}..{result.sizes[-1]}" if result.sizes else "-"
+        cells = [
+            (
+                f"{exponents[phase]:>6.2f}"
+                if exponents.get(phase) is not None
+                else f"{'-':>6}"
+            )
+            for phase in FITTED_PHASES
+        ]
+        line = f"{result.day:>3}  {sizes:>17}  " + "  ".join(cells)
+        if result.error:
+            line += f"  ({result.error})"
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.scaling",
+        description="Fits the empirical complexity of the solvers on generated inputs of doubling sizes.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=parse_days,
+        help="Days to run, e.g. 7 or 1-5. Runs all discovered days by default.",
+    )
+    parser.add_argument(
+        "-p", "--parts", nargs="+", type=int, choices=(1, 2), default=[1, 2]
+    )
+    parser.add_argument(
+        "--start",
+        type=int,
+        help="The first input size (default: the BASE_SIZE of each generator).",
+    )
+    parser.add_argument(
+        "--steps", type=int, default=5, help="Number of doublings (default: 5)."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-r", "--repeat", type=int, default=1)
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=10.0,
+        help="Stop doubling once a single run takes longer than this, in seconds (default: 10).",
+    )
+    parser.add_argument(
+        "--max-exponent",
+        type=float,
+        help="Exit with an error if any fitted exponent is larger than this.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    days = sorted({day for days in args.days for day in days}) or discover_days()
+
+    results = []
+    for day in days:
+        result = run_scaling(
+            day,
+            args.start,
+            args.steps,
+            args.seed,
+            args.parts,
+            args.repeat,
+            args.time_limit,
+        )
+        results.append(result)
+
+    if args.json:
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+    else:
+        print(format_table(results))
+
+    if args.max_exponent is None:
+        return 0
+
+    exceeded = [
+        (result.day, phase, exponent)
+        for result in results
+        for phase, exponent in result.exponents().items()
+        if exponent is not None and exponent > args.max_exponent
+    ]
+    for day, phase, exponent in exceeded:
+        print(
+            f"day {day:02d} {phase}: exponent {exponent:.2f} > {args.max_exponent}",
+            file=sys.stderr,
+        )
+
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
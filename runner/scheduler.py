@@ -0,0 +1,225 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent import futures
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import mean
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import discovery
+from .timing import RunResult, run_day
+
+
+@dataclass(frozen=True)
+class Job:
+    """
+    A single run of the solver of a day on one input file.
+    """
+
+    day: int
+    input_file: str
+
+    # The number of CPUs that are reserved for the job while it runs.
+    processes: int = 1
+
+
+class TimingHistory:
+    """
+    The total wall-clock time of the previous run of each job, stored as JSON.
+    Used to estimate how long each job takes, so that the longest jobs can be started first.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        try:
+            self.timings: Dict[str, float] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.timings = {}
+
+    @staticmethod
+    def key(day: int, input_file: str) -> str:
+        return f"{day:02d}:{Path(input_file).resolve()}"
+
+    def estimate(self, job: Job) -> Optional[float]:
+        """
+        Estimates the wall-clock time of the job from its previous run.
+        Falls back to the mean time of the other inputs of the same day, since inputs of a day take similar times.
+        :return: The estimate in seconds, or None if the day has never been run
+        """
+        key = self.key(job.day, job.input_file)
+        if key in self.timings:
+            return self.timings[key]
+
+        prefix = f"{job.day:02d}:"
+        same_day = [t for k, t in self.timings.items() if k.startswith(prefix)]
+        return mean(same_day) if same_day else None
+
+    def record(self, result: RunResult) -> None:
+        summary = result.summary()
+        total = sum(timing["wall"]["median"] for timing in summary.values())
+        self.timings[self.key(result.day, result.input_file)] = total
+
+    def save(self) -> None:
+        # Write to a temporary file first, so that an interrupted run never corrupts the history.
+        temp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(self.timings, indent=2, sort_keys=True))
+        os.replace(temp, self.path)
+
+
+def sort_jobs(jobs: Iterable[Job], history: TimingHistory) -> List[Job]:
+    """
+    Sorts the jobs longest first, which keeps a long job from starting last and running on its own.
+    Jobs of days that have never been run come first, since they might be the longest.
+    """
+
+    def priority(job: Job) -> Tuple[bool, float]:
+        estimate = history.estimate(job)
+        return estimate is not None, -(estimate or 0)
+
+    return sorted(jobs, key=priority)
+
+
+def run_job(job: Job, parts: Iterable[int], repeat: int) -> RunResult:
+    """
+    Runs a job in a worker process. The number of processes of the solver is lowered to the CPUs that are reserved
+    for the job, so that solvers with their own pool (e.g. day16) stay within the budget.
+    """
+    discovery.load_solver(job.day).PROCESSES = job.processes
+    return run_day(job.day, job.input_file, parts, repeat)
+
+
+def schedule(
+    jobs: List[Job], cpus: int, parts: Iterable[int] = (1, 2), repeat: int = 1
+) -> Iterator[Tuple[Job, Optional[RunResult], Optional[BaseException]]]:
+    """
+    Runs the jobs on a process pool in the given order, without reserving more than the given number of CPUs at once.
+    Jobs are started strictly in order, so a job waits until enough CPUs are free for it.
+    :return: An iterator of (job, result, error) tuples, in the order that the jobs finish
+    """
+    pending = deque(jobs)
+    running: Dict[futures.Future, Job] = {}
+    free = cpus
+
+    with futures.ProcessPoolExecutor(cpus) as executor:
+        while pending or running:
+            while pending and pending[0].processes <= free:
+                job = pending.popleft()
+                running[executor.submit(run_job, job, parts, repeat)] = job
+                free -= job.processes
+
+            done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                free += job.processes
+
+                error = future.exception()
+                yield job, None if error else future.result(), error
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.scheduler",
+        description="Runs the solvers on many input files concurrently, on a process pool.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=discovery.parse_days,
+        help="Days to run, e.g. 7 or 1-5. Runs all discovered days by default.",
+    )
+    parser.add_argument(
+        "-p", "--parts", nargs="+", type=int, choices=(1, 2), default=[1, 2]
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        default=discovery.DEFAULT_INPUT,
+        help="Input file pattern, formatted with the day number. May contain glob wildcards, "
+        'e.g. "inputs/day{day:02d}/*.txt" (default: dayNN/input.txt).',
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=1)
+    parser.add_argument(
+        "-j",
+        "--cpus",
+        type=int,
+        default=os.cpu_count(),
+        help="Maximum number of CPUs to use at once (default: all of them).",
+    )
+    parser.add_argument(
+        "--history",
+        default=discovery.DEFAULT_HISTORY,
+        help="File of previous timings, used to start the longest jobs first (default: .timing_history.json).",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print each result as a line of JSON as soon as it finishes.",
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    available = discovery.discover_days()
+    days = sorted({day for days in args.days for day in days}) or available
+    history = TimingHistory(args.history)
+    failed = 0
+
+    jobs = []
+    for day in days:
+        if day not in available:
+            print(f"day {day:02d}: no solver found, skipping", file=sys.stderr)
+            continue
+
+        input_files = discovery.input_paths(day, args.input)
+        if not input_files:
+            print(f"day {day:02d}: no input files found, skipping", file=sys.stderr)
+            continue
+
+        try:
+            solver_cls = discovery.load_solver(day)
+        except ImportError as e:
+            failed += 1
+            print(f"day {day:02d}: {type(e).__name__}: {e}", file=sys.stderr)
+            continue
+
+        # Solvers that use more CPUs than the budget are capped, rather than never being scheduled.
+        processes = min(solver_cls.PROCESSES, args.cpus)
+        jobs += [Job(day, str(path), processes) for path in input_files]
+
+    start = time.perf_counter()
+    try:
+        for job, result, error in schedule(
+            sort_jobs(jobs, history), args.cpus, args.parts, args.repeat
+        ):
+            if error is not None:
+                failed += 1
+                print(
+                    f"day {job.day:02d} {job.input_file}: {type(error).__name__}: {error}",
+                    file=sys.stderr,
+                )
+                continue
+
+            history.record(result)
+            if args.json:
+                print(json.dumps(result.to_dict()), flush=True)
+            else:
+                answers = ", ".join(f"{k}={v}" for k, v in result.answers.items())
+                print(f"day {job.day:02d} {job.input_file}: {answers}", flush=True)
+    finally:
+        history.save()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{len(jobs)} jobs on {args.cpus} CPUs in {elapsed:.2f}s, {failed} failed",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+import argparse
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+from . import discovery
+
+# The code that is timed for each day: everything that a single-day run imports before it starts solving.
+STARTUP_CODE = (
+    "import runner.__main__, runner.discovery; runner.discovery.load_solver({day})"
+)
+
+# The number of slowest imports listed for each day.
+TOP_IMPORTS = 3
+
+
+def time_command(code: str, importtime: bool = False) -> Tuple[float, str]:
+    """
+    Runs the code in a fresh interpreter from the repository root.
+    :return: A tuple of (wall-clock time in seconds, stderr)
+    """
+    command = [sys.executable] + (["-X", "importtime"] if importtime else [])
+    start = time.perf_counter()
+    process = subprocess.run(
+        command + ["-c", code], cwd=discovery.ROOT, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    return elapsed, process.stderr
+
+
+def parse_importtime(report: str) -> Dict[str, int]:
+    """
+    Parses the report of python -X importtime.
+    :return: A mapping of module -> self import time in microseconds
+    """
+    result = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, _, module = line[len("import time:") :].split("|")
+        result[module.strip()] = int(self_us)
+
+    return result
+
+
+@dataclass
+class StartupResult:
+    """
+    The cold-start time of a single-day run, in seconds, over all repeats.
+    """
+
+    day: int
+    times: List[float] = field(default_factory=list)
+
+    # The import time of each module, in seconds.
+    imports: Dict[str, float] = field(default_factory=dict)
+
+    # The reason the day could not be started, if any.
+    error: Optional[str] = None
+
+    def median_time(self) -> Optional[float]:
+        return median(self.times) if self.times else None
+
+    def import_time(self) -> float:
+        return sum(self.imports.values())
+
+    def slowest_imports(self, count: int = TOP_IMPORTS) -> List[Tuple[str, float]]:
+        return sorted(self.imports.items(), key=lambda item: -item[1])[:count]
+
+    def to_dict(self):
+        return {
+            "day": self.day,
+            "times": self.times,
+            "median": self.median_time(),
+            "import_time": self.import_time(),
+            "slowest_imports": dict(self.slowest_imports()),
+            "error": self.error,
+        }
+
+
+def run_startup(day: int, repeat: int = 5) -> StartupResult:
+    """
+    Times the startup of a single-day run of the given day, in a fresh interpreter each time.
+    The imports are profiled in one extra run, since -X importtime slows the interpreter down.
+    """
+    result = StartupResult(day)
+    code = STARTUP_CODE.format(day=day)
+
+    try:
+        for _ in range(repeat):
+            result.times.append(time_command(code)[0])
+
+        _, report = time_command(code, importtime=True)
+    except RuntimeError as e:
+        result.error = str(e)
+        return result
+
+    result.imports = {
+        module: us / 1e6 for module, us in parse_importtime(report).items()
+    }
+    return result
+
+
+def format_table(results: List[StartupResult], baseline: float) -> str:
+    """
+    Formats the median startup time of each day, the time over the bare interpreter startup,
+    and the total time spent importing modules, in milliseconds.
+    """
+    header = (
+        f"{'day':>3}  {'startup':>9}  {'overhead':>9}  {'imports':>9}  slowest imports"
+    )
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        if result.error:
+            lines.append(
+                f"{result.day:>3}  {'-':>9}  {'-':>9}  {'-':>9}  ({result.error})"
+            )
+            continue
+
+        startup = result.median_time() * 1000
+        overhead = startup - baseline * 1000
+        imports = result.import_time() * 1000
+        slowest = ", ".join(
+            f"{module} {seconds * 1000:.1f}"
+            for module, seconds in result.slowest_imports()
+        )
+        lines.append(
+            f"{result.day:>3}  {startup:>9.1f}  {overhead:>9.1f}  {imports:>9.1f}  {slowest}"
+        )
+
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.startup",
+        description="Benchmarks the cold-start time of single-day runs, in a fresh interpreter each time.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=discovery.parse_days,
+        help="Days to run, e.g. 7 or 1-5. Runs all discovered days by default.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed starts per day (default: 5).",
+    )
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="Exit with an error if the startup of any day takes longer than this over the bare interpreter, "
+        "in milliseconds.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    days = sorted({day for days in args.days for day in days})
+    days = days or discovery.discover_days()
+
+    # The startup of the bare interpreter is measured the same way, so that it can be subtracted.
+    baseline = median(time_command("pass")[0] for _ in range(args.repeat))
+    results = [run_startup(day, args.repeat) for day in days]
+
+    if args.json:
+        output = {
+            "baseline": baseline,
+            "results": [result.to_dict() for result in results],
+        }
+        print(json.dumps(output, indent=2))
+    else:
+        print(f"interpreter startup: {baseline * 1000:.1f} ms")
+        print(format_table(results, baseline))
+
+    exceeded = [
+        result
+        for result in results
+        if args.max_ms is not None
+        and not result.error
+        and (result.median_time() - baseline) * 1000 > args.max_ms
+    ]
+    for result in exceeded:
+        print(
+            f"day {result.day:02d}: startup {(result.median_time() - baseline) * 1000:.1f} ms "
+            f"> {args.max_ms} ms",
+            file=sys.stderr,
+        )
+
+    failed = [result for result in results if result.error]
+    return 1 if exceeded or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+import os
+import time
+import typing
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+import instrumentation
+from advent_of_code_solver import BaseSolver
+
+from .discovery import load_solver
+
+if typing.TYPE_CHECKING:
+    from parse_cache import ParseCache
+
+    from .profiling import Profiler
+
+# The phases of a solver run, in the order that they are executed.
+READ = "read"
+PARSE = "parse"
+PART1 = "part1"
+PART2 = "part2"
+# Solvers that share work between the parts solve them together, so they are timed as a single phase.
+BOTH = "both"
+# In streaming mode, reading, parsing and solving are interleaved, so they are timed as a single phase.
+STREAM = "stream"
+PHASES = (READ, PARSE, PART1, PART2, BOTH, STREAM)
+
+
+# The runner imports this module on every run, so its classes do not use dataclasses, which is slow to import.
+class PhaseTiming(typing.NamedTuple):
+    """
+    The wall-clock and CPU time of a single phase, in seconds.
+    """
+
+    wall: float
+    cpu: float
+
+
+def cpu_time() -> float:
+    """
+    Returns the CPU time used by this process and its terminated children.
+    Children are included since some solvers (e.g. day16) use a multiprocessing pool.
+    """
+    t = os.times()
+    return time.process_time() + t.children_user + t.children_system
+
+
+def measure(func: Callable, *args) -> Tuple[Any, PhaseTiming]:
+    """
+    Calls the function with the given arguments and measures its wall-clock and CPU time.
+    :return: A tuple of (result, timing)
+    """
+    wall_start, cpu_start = time.perf_counter(), cpu_time()
+    result = func(*args)
+    wall_end, cpu_end = time.perf_counter(), cpu_time()
+
+    return result, PhaseTiming(wall_end - wall_start, cpu_end - cpu_start)
+
+
+def report_name(solver_cls: Type[BaseSolver], phase: str) -> str:
+    """
+    Returns the name of the profiling reports of a phase, e.g. "day17.part1".
+    """
+    return f"{solver_cls.__module__.partition('.')[0]}.{phase}"
+
+
+def measure_phase(
+    solver: BaseSolver,
+    phase: str,
+    profiler: Optional["Profiler"],
+    func: Callable,
+    *args,
+) -> Tuple[Any, PhaseTiming]:
+    """
+    Measures a phase of a solver like measure, profiling it first if a profiler is given.
+    """
+    if profiler is not None:
+        func = profiler.wrap(report_name(type(solver), phase), func)
+
+    return measure(func, *args)
+
+
+def read_bytes(input_file: str) -> bytes:
+    with open(input_file, "rb") as file:
+        return file.read()
+
+
+class RunResult:
+    """
+    The answers and per-phase timings of a single day, over all repeats.
+    """
+
+    def __init__(self, day: int, input_file: str, engine: str = "python"):
+        self.day = day
+        self.input_file = input_file
+        self.engine = engine
+        self.answers: Dict[str, Any] = {}
+        self.timings: Dict[str, List[PhaseTiming]] = {}
+
+        # The counters and timers of the last repeat, if instrumentation is enabled.
+        self.instrumentation: Dict[str, Dict[str, float]] = {}
+
+        # The peak traced memory of each phase in bytes, if memory profiling is enabled.
+        self.peak_memory: Dict[str, int] = {}
+
+    def add_timing(self, phase: str, timing: PhaseTiming) -> None:
+        self.timings.setdefault(phase, []).append(timing)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Summarises the timings of each phase.
+        :return: A mapping of phase -> clock ("wall" or "cpu") -> statistic -> seconds
+        """
+        # statistics is slow to import, and only needed once the runs are done.
+        from statistics import mean, median
+
+        result = {}
+
+        for phase in PHASES:
+            if phase not in self.timings:
+                continue
+
+            result[phase] = {}
+            for clock in ("wall", "cpu"):
+                values = [getattr(timing, clock) for timing in self.timings[phase]]
+                result[phase][clock] = {
+                    "min": min(values),
+                    "median": median(values),
+                    "mean": mean(values),
+                }
+
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "day": self.day,
+            "input_file": self.input_file,
+            "engine": self.engine,
+            "answers": {part: str(answer) for part, answer in self.answers.items()},
+            "repeats": max(map(len, self.timings.values()), default=0),
+            "timings": self.summary(),
+        }
+        if self.instrumentation:
+            result["instrumentation"] = self.instrumentation
+        if self.peak_memory:
+            result["peak_memory"] = self.peak_memory
+        return result
+
+
+def solve_parsed(
+    solver: BaseSolver, parts: Iterable[int], profiler: Optional["Profiler"] = None
+) -> Tuple[Dict[str, Any], Dict[str, PhaseTiming]]:
+    """
+    Solves the given parts of a solver whose input has already been loaded, timing each part separately.
+    If both parts are requested, solvers that share work between them solve them together.
+    :return: A tuple of (answers, timings), both keyed by phase
+    """
+    answers, timings = {}, {}
+
+    if set(parts) == {1, 2} and solver.shares_work():
+        both, timings[BOTH] = measure_phase(solver, BOTH, profiler, solver.solve_both)
+        answers[PART1], answers[PART2] = both
+    else:
+        for part in parts:
+            phase = f"part{part}"
+            func = getattr(solver, f"solve_{phase}")
+            answers[phase], timings[phase] = measure_phase(
+                solver, phase, profiler, func
+            )
+
+    return answers, timings
+
+
+def run_day(
+    day: int,
+    input_file: str,
+    parts: Iterable[int] = (1, 2),
+    repeat: int = 1,
+    warmup: int = 0,
+    cache: Optional["ParseCache"] = None,
+    stream: bool = False,
+    profiler: Optional["Profiler"] = None,
+    engine: Optional[str] = None,
+) -> RunResult:
+    """
+    Runs the solver of the given day, timing each phase separately.
+    A fresh solver is created for every iteration, since several solvers mutate their parsed input while solving.
+    :param day: The day number
+    :param input_file: The path to the input file
+    :param parts: The parts to solve. If both are requested, solvers that share work between them solve them together.
+    :param repeat: The number of timed iterations
+    :param warmup: The number of untimed iterations to run before the timed ones
+    :param cache: An optional parse cache. On a cache hit, the parse phase only loads the cached input.
+    :param stream: Whether to solve both parts in a single pass over the lines, for solvers that support it
+    :param profiler: An optional profiler, which profiles every phase except for reading the file
+    :param engine: The engine to run the solver with, which must be one of the engines of some solver.
+        Solvers that do not have it run with their default engine.
+    """
+    solver_cls = load_solver(day)
+    if engine not in solver_cls.ENGINES:
+        engine = solver_cls.ENGINES[0]
+    result = RunResult(day, str(input_file), engine)
+
+    for iteration in range(warmup + repeat):
+        solver = solver_cls(input_file, engine)
+        timings = {}
+        instrumentation.reset()
+
+        if stream and solver_cls.supports_streaming():
+            lines = solver.stream_input_file()
+            answers, timings[STREAM] = measure_phase(
+                solver, STREAM, profiler, solver.solve_stream, lines
+            )
+            for part in parts:
+                result.answers[f"part{part}"] = answers[part - 1]
+
+        else:
+            # Read the whole file first, so that parsing can be timed on its own.
+            data, timings[READ] = measure(read_bytes, input_file)
+            _, timings[PARSE] = measure_phase(
+                solver, PARSE, profiler, solver.load_input, data, cache
+            )
+
+            answers, part_timings = solve_parsed(solver, parts, profiler)
+            result.answers.update(answers)
+            timings.update(part_timings)
+
+        if iteration >= warmup:
+            for phase, timing in timings.items():
+                result.add_timing(phase, timing)
+
+    if instrumentation.enabled:
+        result.instrumentation = instrumentation.snapshot()
+    if profiler is not None and profiler.memory:
+        for phase in result.timings:
+            name = report_name(solver_cls, phase)
+            if name in profiler.peaks:
+                result.peak_memory[phase] = profiler.peaks[name]
+
+    return result